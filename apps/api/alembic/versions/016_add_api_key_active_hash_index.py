@@ -0,0 +1,40 @@
+"""Add partial index for active API key lookups
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so key authentication keeps working during the migration
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_api_keys_hashed_key_active',
+            'api_keys',
+            ['hashed_key'],
+            unique=True,
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_api_keys_hashed_key_active',
+            table_name='api_keys',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,42 @@
+"""Add trigram indexes for job search
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-15 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_jobs_search_trgm',
+        'jobs',
+        ['serial_number', 'batch_id', 'customer_reference'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={
+            'serial_number': 'gin_trgm_ops',
+            'batch_id': 'gin_trgm_ops',
+            'customer_reference': 'gin_trgm_ops',
+        },
+    )
+    op.execute(
+        "CREATE INDEX ix_jobs_ticket_id_trgm ON jobs USING gin ((ticket_id::text) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_ticket_id_trgm', table_name='jobs')
+    op.drop_index('ix_jobs_search_trgm', table_name='jobs')
@@ -0,0 +1,36 @@
+"""Sync the ticket_id identity sequence with existing tickets
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-15 10:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Ticket IDs used to be assigned explicitly from max(ticket_id) + 1, so the
+    # identity sequence never advanced. Move it past the highest issued ticket
+    # before the application starts relying on it.
+    op.execute(
+        "SELECT setval("
+        "pg_get_serial_sequence('jobs', 'ticket_id'), "
+        "GREATEST(COALESCE((SELECT max(ticket_id) FROM jobs), 0), 10000)"
+        ")"
+    )
+
+
+def downgrade() -> None:
+    # Sequence positions are not rolled back; the previous max(ticket_id)
+    # allocation is unaffected by where the sequence stands.
+    pass
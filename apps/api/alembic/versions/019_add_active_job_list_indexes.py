@@ -0,0 +1,54 @@
+"""Add partial indexes for the active job list
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '019'
+down_revision: Union[str, None] = '018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The job list always filters out soft-deleted rows and orders by
+    # created_at DESC, optionally narrowed by status or technician
+    op.create_index(
+        'ix_jobs_active_created_at',
+        'jobs',
+        [sa.text('created_at DESC')],
+        unique=False,
+        postgresql_include=['status', 'assigned_technician_id', 'customer_reference'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'ix_jobs_active_technician_created_at',
+        'jobs',
+        ['assigned_technician_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    # Supersedes the full-table (status, created_at) index from 012
+    op.drop_index('ix_jobs_status_created_at', table_name='jobs')
+    op.create_index(
+        'ix_jobs_active_status_created_at',
+        'jobs',
+        ['status', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_active_status_created_at', table_name='jobs')
+    op.create_index('ix_jobs_status_created_at', 'jobs', ['status', 'created_at'], unique=False)
+    op.drop_index('ix_jobs_active_technician_created_at', table_name='jobs')
+    op.drop_index('ix_jobs_active_created_at', table_name='jobs')
@@ -0,0 +1,37 @@
+"""Add partial index for the SLA checker
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '020'
+down_revision: Union[str, None] = '019'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only open jobs that have not been flagged as breached yet are candidates
+    # for an SLA alert, which keeps this index a small slice of the table
+    op.create_index(
+        'ix_jobs_sla_open',
+        'jobs',
+        ['sla_due_at'],
+        unique=False,
+        postgresql_where=sa.text(
+            "deleted_at IS NULL AND sla_breach_notified_at IS NULL "
+            "AND status NOT IN ('completed', 'failed')"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_sla_open', table_name='jobs')
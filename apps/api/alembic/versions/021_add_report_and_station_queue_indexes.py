@@ -0,0 +1,39 @@
+"""Add indexes for report versioning and the station queue
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '021'
+down_revision: Union[str, None] = '020'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create_report counts earlier versions by (job_id, scope, variant)
+    op.create_index(
+        'ix_reports_job_scope_variant',
+        'reports',
+        ['job_id', 'scope', 'variant'],
+        unique=False,
+    )
+    # The station queue filters on the station and orders by updated_at
+    op.create_index(
+        'ix_jobs_station_updated_at',
+        'jobs',
+        ['current_station_id', 'updated_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_station_updated_at', table_name='jobs')
+    op.drop_index('ix_reports_job_scope_variant', table_name='reports')
@@ -0,0 +1,47 @@
+"""Add materialized view for the defect heatmap
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '022'
+down_revision: Union[str, None] = '021'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Failed test results per device model and test step; refreshed
+    # periodically by the defect heatmap cron job
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_defect_heatmap AS
+        SELECT d.model AS model, ts.name AS test_step, count(*) AS failure_count
+        FROM test_results tr
+        JOIN jobs j ON j.id = tr.job_id
+        JOIN devices d ON d.id = j.device_id
+        JOIN test_steps ts ON ts.id = tr.test_step_id
+        WHERE tr.status = 'fail' AND j.deleted_at IS NULL
+        GROUP BY d.model, ts.name
+    """)
+    # REFRESH ... CONCURRENTLY needs a unique index on the view
+    op.create_index(
+        'ux_mv_defect_heatmap_model_step',
+        'mv_defect_heatmap',
+        ['model', 'test_step'],
+        unique=True,
+    )
+    op.execute(
+        "CREATE INDEX ix_mv_defect_heatmap_failure_count "
+        "ON mv_defect_heatmap (failure_count DESC)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW mv_defect_heatmap")
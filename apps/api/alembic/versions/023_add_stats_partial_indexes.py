@@ -0,0 +1,55 @@
+"""Add partial indexes for stats queries
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-15 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '023'
+down_revision: Union[str, None] = '022'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Technician leaderboard: completed jobs in a date range, counted per
+    # technician straight from the index
+    op.create_index(
+        'ix_jobs_completed_at_technician',
+        'jobs',
+        ['completed_at'],
+        unique=False,
+        postgresql_include=['assigned_technician_id'],
+        postgresql_where=sa.text("deleted_at IS NULL AND status = 'completed'"),
+    )
+    # Floor view: open jobs per station, including the unassigned (NULL) bucket
+    op.create_index(
+        'ix_jobs_open_station',
+        'jobs',
+        ['current_station_id'],
+        unique=False,
+        postgresql_where=sa.text(
+            "deleted_at IS NULL AND status NOT IN ('completed', 'failed')"
+        ),
+    )
+    # Defect heatmap refresh only reads failed results
+    op.create_index(
+        'ix_test_results_failed',
+        'test_results',
+        ['job_id', 'test_step_id'],
+        unique=False,
+        postgresql_where=sa.text("status = 'fail'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_test_results_failed', table_name='test_results')
+    op.drop_index('ix_jobs_open_station', table_name='jobs')
+    op.drop_index('ix_jobs_completed_at_technician', table_name='jobs')
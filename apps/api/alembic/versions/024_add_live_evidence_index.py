@@ -0,0 +1,34 @@
+"""Add live evidence index for evidence listings
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-15 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '024'
+down_revision: Union[str, None] = '023'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Evidence lists read a job's current (non-superseded) items newest
+    # first, so they come back in index order without a sort
+    op.create_index(
+        'ix_evidence_job_captured_live',
+        'evidence',
+        ['job_id', sa.text('captured_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('superseded_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_evidence_job_captured_live', table_name='evidence')
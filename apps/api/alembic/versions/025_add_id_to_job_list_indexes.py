@@ -0,0 +1,61 @@
+"""Add id tie-breaker to job list indexes for keyset paging
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-15 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '025'
+down_revision: Union[str, None] = '024'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_indexes(order: list) -> None:
+    op.create_index(
+        'ix_jobs_active_created_at',
+        'jobs',
+        order,
+        unique=False,
+        postgresql_include=['status', 'assigned_technician_id', 'customer_reference'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'ix_jobs_active_technician_created_at',
+        'jobs',
+        ['assigned_technician_id', *order],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'ix_jobs_active_status_created_at',
+        'jobs',
+        ['status', *order],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def _drop_indexes() -> None:
+    op.drop_index('ix_jobs_active_status_created_at', table_name='jobs')
+    op.drop_index('ix_jobs_active_technician_created_at', table_name='jobs')
+    op.drop_index('ix_jobs_active_created_at', table_name='jobs')
+
+
+def upgrade() -> None:
+    # The job list pages by (created_at, id) so rows sharing a timestamp are
+    # neither skipped nor repeated; end every list index on that pair
+    _drop_indexes()
+    _create_indexes([sa.text('created_at DESC'), sa.text('id DESC')])
+
+
+def downgrade() -> None:
+    _drop_indexes()
+    _create_indexes([sa.text('created_at DESC')])
@@ -0,0 +1,64 @@
+"""Make test results unique per job and step
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-15 23:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '026'
+down_revision: Union[str, None] = '025'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Older code could race two inserts for the same step. Keep the most
+    # recently performed result, moving evidence off the duplicates first so
+    # the cascade doesn't take it with them.
+    op.execute(
+        sa.text(
+            """
+            WITH ranked AS (
+                SELECT id,
+                       first_value(id) OVER w AS keep_id,
+                       row_number() OVER w AS rn
+                FROM test_results
+                WINDOW w AS (
+                    PARTITION BY job_id, test_step_id
+                    ORDER BY performed_at DESC, id DESC
+                )
+            )
+            UPDATE evidence SET test_result_id = ranked.keep_id
+            FROM ranked
+            WHERE evidence.test_result_id = ranked.id AND ranked.rn > 1
+            """
+        )
+    )
+    op.execute(
+        sa.text(
+            """
+            DELETE FROM test_results t
+            USING test_results keep
+            WHERE keep.job_id = t.job_id
+              AND keep.test_step_id = t.test_step_id
+              AND (keep.performed_at, keep.id) > (t.performed_at, t.id)
+            """
+        )
+    )
+    op.create_index(
+        'ux_test_results_job_step',
+        'test_results',
+        ['job_id', 'test_step_id'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_test_results_job_step', table_name='test_results')
@@ -1,10 +1,15 @@
 """JWT token handling."""
 
 from datetime import UTC, datetime, timedelta
+from hashlib import blake2b
 
-from jose import JWTError, jwt
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hmac
+from jose import JWTError, jwk, jwt
+from jose.backends.cryptography_backend import CryptographyHMACKey
 from pydantic import BaseModel
 
+from veriqko.cache import TTLCache
 from veriqko.config import get_settings
 
 
@@ -28,11 +33,53 @@ class TokenPair(BaseModel):
     expires_in: int  # seconds
 
 
-def create_access_token(user_id: str, email: str, role: str) -> str:
+class _PreparedHMACKey(CryptographyHMACKey):
+    """HMAC key that keys OpenSSL once and copies that state per signature."""
+
+    def __init__(self, key: str, algorithm: str):
+        super().__init__(key, algorithm)
+        self._hmac = hmac.HMAC(self.prepared_key, self._hash_alg)
+
+    def sign(self, msg: bytes) -> bytes:
+        h = self._hmac.copy()
+        h.update(msg)
+        return h.finalize()
+
+    def verify(self, msg: bytes, sig: bytes) -> bool:
+        h = self._hmac.copy()
+        h.update(msg)
+        try:
+            h.verify(sig)
+        except InvalidSignature:
+            return False
+        return True
+
+
+# Settings are read once at import; these run on every authenticated request
+_settings = get_settings()
+_ALGORITHM = _settings.jwt_algorithm
+# Built once rather than on every encode and decode
+if _ALGORITHM in ("HS256", "HS384", "HS512"):
+    _KEY = _PreparedHMACKey(_settings.jwt_secret_key, _ALGORITHM)
+else:
+    _KEY = jwk.construct(_settings.jwt_secret_key, _ALGORITHM)
+_ACCESS_TOKEN_TTL = timedelta(minutes=_settings.jwt_access_token_expire_minutes)
+_REFRESH_TOKEN_TTL = timedelta(days=_settings.jwt_refresh_token_expire_days)
+_MFA_TOKEN_TTL = timedelta(minutes=5)  # 5 minutes to complete MFA
+
+# Decoded tokens keyed by a hash of the token. Only verified tokens are
+# cached, and an entry never outlives the token's own expiry.
+_token_cache: TTLCache[bytes, TokenPayload] = TTLCache(
+    _settings.jwt_decode_cache_ttl_seconds, _settings.jwt_decode_cache_max_entries
+)
+
+
+def create_access_token(
+    user_id: str, email: str, role: str, now: datetime | None = None
+) -> str:
     """Create a new access token."""
-    settings = get_settings()
-    now = datetime.now(UTC)
-    expire = now + timedelta(minutes=settings.jwt_access_token_expire_minutes)
+    now = now or datetime.now(UTC)
+    expire = now + _ACCESS_TOKEN_TTL
 
     payload = {
         "sub": user_id,
@@ -43,14 +90,15 @@ def create_access_token(user_id: str, email: str, role: str) -> str:
         "type": "access",
     }
 
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return jwt.encode(payload, _KEY, algorithm=_ALGORITHM)
 
 
-def create_refresh_token(user_id: str, email: str, role: str) -> str:
+def create_refresh_token(
+    user_id: str, email: str, role: str, now: datetime | None = None
+) -> str:
     """Create a new refresh token."""
-    settings = get_settings()
-    now = datetime.now(UTC)
-    expire = now + timedelta(days=settings.jwt_refresh_token_expire_days)
+    now = now or datetime.now(UTC)
+    expire = now + _REFRESH_TOKEN_TTL
 
     payload = {
         "sub": user_id,
@@ -61,14 +109,13 @@ def create_refresh_token(user_id: str, email: str, role: str) -> str:
         "type": "refresh",
     }
 
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return jwt.encode(payload, _KEY, algorithm=_ALGORITHM)
 
 
 def create_mfa_token(user_id: str) -> str:
     """Create a temporary token for MFA verification."""
-    settings = get_settings()
     now = datetime.now(UTC)
-    expire = now + timedelta(minutes=5)  # 5 minutes to complete MFA
+    expire = now + _MFA_TOKEN_TTL
 
     payload = {
         "sub": user_id,
@@ -77,35 +124,50 @@ def create_mfa_token(user_id: str) -> str:
         "type": "mfa_temp",
     }
 
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return jwt.encode(payload, _KEY, algorithm=_ALGORITHM)
 
 
 def create_token_pair(user_id: str, email: str, role: str) -> TokenPair:
     """Create access and refresh token pair."""
-    settings = get_settings()
-
+    # Both tokens share one issue time
+    now = datetime.now(UTC)
     return TokenPair(
-        access_token=create_access_token(user_id, email, role),
-        refresh_token=create_refresh_token(user_id, email, role),
-        expires_in=settings.jwt_access_token_expire_minutes * 60,
+        access_token=create_access_token(user_id, email, role, now),
+        refresh_token=create_refresh_token(user_id, email, role, now),
+        expires_in=int(_ACCESS_TOKEN_TTL.total_seconds()),
     )
 
 
-def decode_token(token: str) -> TokenPayload | None:
-    """Decode and validate a JWT token."""
-    settings = get_settings()
+def _cache_key(token: str) -> bytes:
+    return blake2b(token.encode(), digest_size=16).digest()
+
+
+def _cache_payload(cache_key: bytes, payload: TokenPayload) -> None:
+    remaining = (payload.exp - datetime.now(UTC)).total_seconds()
+    _token_cache.set(cache_key, payload, ttl_seconds=remaining)
 
+
+def _decode_uncached(token: str) -> TokenPayload | None:
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
+        payload = jwt.decode(token, _KEY, algorithms=[_ALGORITHM])
         return TokenPayload(**payload)
     except JWTError:
         return None
 
 
+def decode_token(token: str) -> TokenPayload | None:
+    """Decode and validate a JWT token."""
+    cache_key = _cache_key(token)
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    token_payload = _decode_uncached(token)
+    if token_payload is not None:
+        _cache_payload(cache_key, token_payload)
+    return token_payload
+
+
 def verify_token(token: str, token_type: str = "access") -> TokenPayload | None:
     """Verify a token is valid and of the correct type."""
     payload = decode_token(token)
@@ -117,3 +179,4 @@ def verify_token(token: str, token_type: str = "access") -> TokenPayload | None:
         return None
 
     return payload
+
@@ -20,11 +20,13 @@ from veriqko.auth.service import AuthService
 from veriqko.auth.mfa import generate_mfa_secret, get_mfa_uri, verify_mfa_code
 from veriqko.config import get_settings
 from veriqko.db.base import get_db
-from veriqko.dependencies import get_current_user
+from veriqko.dependencies import get_current_user, invalidate_cached_user
 from veriqko.users.models import User
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+_ACCESS_TOKEN_EXPIRES_IN = get_settings().jwt_access_token_expire_minutes * 60
+
 
 @router.post("/login", response_model=LoginResponse)
 async def login(
@@ -98,6 +100,7 @@ async def setup_mfa(
     secret = generate_mfa_secret()
     current_user.mfa_secret = secret
     await db.commit()
+    invalidate_cached_user(current_user.id)
     
     uri = get_mfa_uri(current_user, secret)
     return MFASetupResponse(secret=secret, uri=uri)
@@ -112,6 +115,8 @@ async def verify_mfa_setup(
     if current_user.mfa_enabled:
         raise HTTPException(status_code=400, detail="MFA is already enabled")
         
+    # The cached user carries no secrets, so read this one from the row
+    await db.refresh(current_user, ["mfa_secret"])
     if not current_user.mfa_secret:
         raise HTTPException(status_code=400, detail="MFA setup not initiated")
         
@@ -120,6 +125,7 @@ async def verify_mfa_setup(
         
     current_user.mfa_enabled = True
     await db.commit()
+    invalidate_cached_user(current_user.id)
     await db.refresh(current_user)
     
     return UserResponse.model_validate(current_user)
@@ -152,7 +158,6 @@ async def refresh_token(
         )
 
     # Create new access token
-    settings = get_settings()
     access_token = create_access_token(
         user_id=user.id,
         email=user.email,
@@ -162,7 +167,7 @@ async def refresh_token(
     return RefreshResponse(
         access_token=access_token,
         token_type="bearer",
-        expires_in=settings.jwt_access_token_expire_minutes * 60,
+        expires_in=_ACCESS_TOKEN_EXPIRES_IN,
     )
 
 
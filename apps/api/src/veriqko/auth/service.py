@@ -2,6 +2,7 @@
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from veriqko.auth.jwt import TokenPair, create_token_pair
 from veriqko.auth.password import verify_password
@@ -42,9 +43,15 @@ class AuthService:
 
     async def get_user_by_id(self, user_id: str) -> User | None:
         """Get a user by ID."""
-        stmt = select(User).where(
-            User.id == user_id,
-            User.deleted_at.is_(None),
+        # Runs on every authenticated request; its relationships are never
+        # needed there, so make touching one fail loudly
+        stmt = (
+            select(User)
+            .options(raiseload("*"))
+            .where(
+                User.id == user_id,
+                User.deleted_at.is_(None),
+            )
         )
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
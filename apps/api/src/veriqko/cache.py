@@ -0,0 +1,54 @@
+"""Per-process TTL cache shared by the API's small in-memory caches."""
+
+from collections.abc import Hashable
+from time import monotonic
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded cache whose entries expire after a fixed time.
+
+    Each worker process has its own copy, so writes in one worker are only
+    seen by the others once their entries expire. Not thread-safe: only use
+    it from the event loop.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[K, tuple[float, V]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> V:
+        """Store ``value`` and return it; ``ttl_seconds`` can only shorten the TTL."""
+        ttl = self.ttl_seconds if ttl_seconds is None else min(self.ttl_seconds, ttl_seconds)
+        if ttl <= 0:
+            return value
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.max_entries:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            self._entries.pop(next(iter(self._entries)), None)
+        self._entries[key] = (monotonic() + ttl, value)
+        return value
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,31 @@
+"""Defect heatmap refresh task."""
+
+import structlog
+from sqlalchemy import func, select, text
+
+from veriqko.db.base import async_session_factory
+
+logger = structlog.get_logger(__name__)
+
+# Advisory lock key shared by every worker's scheduler
+_REFRESH_LOCK_KEY = 0x6D765F6468  # "mv_dh"
+
+
+async def refresh_defect_heatmap() -> None:
+    """Recompute the materialized view behind the defect heatmap endpoint."""
+    async with async_session_factory() as db:
+        try:
+            # Each worker process runs its own scheduler; the transaction-level
+            # lock lets one of them refresh and the rest skip this round
+            locked = await db.scalar(
+                select(func.pg_try_advisory_xact_lock(_REFRESH_LOCK_KEY))
+            )
+            if not locked:
+                logger.debug("Defect heatmap refresh already running elsewhere")
+                return
+            # CONCURRENTLY keeps the view readable while it is rebuilt
+            await db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_defect_heatmap"))
+            await db.commit()
+            logger.debug("Defect heatmap refreshed")
+        except Exception as e:
+            logger.exception("Error refreshing defect heatmap", error=str(e))
@@ -23,12 +23,14 @@ async def check_sla_breaches():
         try:
             now = datetime.now(UTC)
 
-            # 1. Find jobs that are active and have an SLA
+            # 1. Find active jobs that are due within the warning window and
+            # not yet flagged as breached (served by ix_jobs_sla_open)
             stmt = select(Job).options(
                 selectinload(Job.assigned_technician)
             ).where(
                 Job.status.not_in([JobStatus.COMPLETED, JobStatus.FAILED]),
-                Job.sla_due_at.is_not(None),
+                Job.sla_due_at < now + timedelta(hours=2),
+                Job.sla_breach_notified_at.is_(None),
                 Job.deleted_at.is_(None)
             )
 
@@ -2,11 +2,13 @@
 
 from collections.abc import AsyncGenerator
 from datetime import datetime
+from typing import Any
 from uuid import uuid4
 
 from sqlalchemy import UUID, DateTime, func
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import NullPool
 
 from veriqko.config import get_settings
 
@@ -56,12 +58,28 @@ class UUIDMixin:
 # Engine and session factory
 settings = get_settings()
 
+pool_options: dict[str, Any]
+if settings.database_use_null_pool:
+    pool_options = {"poolclass": NullPool}
+else:
+    pool_options = {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.database_pool_recycle,
+    }
+
 engine = create_async_engine(
     settings.database_url,
-    pool_size=settings.database_pool_size or 20,
-    max_overflow=settings.database_max_overflow or 40,
-    pool_pre_ping=True,
+    **pool_options,
     echo=settings.debug,
+    connect_args={
+        # Sent in the asyncpg startup packet, so applied once per physical
+        # connection rather than per transaction
+        "server_settings": {"jit": "off", "timezone": "UTC"},
+        "prepared_statement_cache_size": settings.database_statement_cache_size,
+    },
 )
 
 async_session_factory = async_sessionmaker(
@@ -1,25 +1,69 @@
 """Shared dependencies for FastAPI."""
 
-from typing import Annotated
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Annotated, Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
 from veriqko.auth.jwt import verify_token
 from veriqko.auth.service import AuthService
+from veriqko.cache import TTLCache
+from veriqko.config import get_settings
 from veriqko.db.base import get_db
 from veriqko.users.models import User, UserRole
 
 # Security scheme
 security = HTTPBearer()
 
+_settings = get_settings()
+# Authenticated users' column values keyed by id. The password hash and MFA
+# secret are left out, so they are never kept in process memory.
+_CACHED_USER_COLUMNS = tuple(
+    attr.key
+    for attr in inspect(User).column_attrs
+    if attr.key not in ("hashed_password", "mfa_secret")
+)
+_user_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+    _settings.current_user_cache_ttl_seconds, _settings.current_user_cache_max_entries
+)
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    """Drop a user from this worker's auth cache after changing them."""
+    _user_cache.invalidate(user_id)
+
+
+async def get_readonly_db(
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> AsyncSession:
+    """Request session for endpoints that only read.
+
+    The session runs in autocommit, so its statements need no BEGIN/COMMIT
+    round trips. List it before get_current_user so it is set up before the
+    session is first used; if it already is, it is left as is.
+    """
+    if not db.in_transaction():
+        await db.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+    return db
+
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> User:
-    """Get the current authenticated user from JWT token."""
+    """Get the current authenticated user from JWT token.
+
+    The user's columns are reused for a few seconds per worker; each request
+    gets its own User merged into its session without a query, so handlers may
+    still modify it. A cached user has no password hash or MFA secret loaded;
+    handlers that need them refresh those attributes.
+    """
     token = credentials.credentials
     payload = verify_token(token, token_type="access")
 
@@ -30,6 +74,14 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cached = _user_cache.get(payload.sub)
+    if cached is not None:
+        cached_user = User()
+        for key, value in cached.items():
+            set_committed_value(cached_user, key, value)
+        make_transient_to_detached(cached_user)
+        return await db.merge(cached_user, load=False)
+
     auth_service = AuthService(db)
     user = await auth_service.get_user_by_id(payload.sub)
 
@@ -46,6 +98,9 @@ async def get_current_user(
             detail="User account is disabled",
         )
 
+    if _user_cache.enabled:
+        _user_cache.set(user.id, {key: getattr(user, key) for key in _CACHED_USER_COLUMNS})
+
     return user
 
 
@@ -58,11 +113,17 @@ async def get_current_active_user(
 
 def require_role(*roles: UserRole):
     """Dependency factory to require specific roles."""
+    return _role_checker(frozenset(roles))
+
 
+@lru_cache
+def _role_checker(allowed: frozenset[UserRole]) -> Callable[[User], Awaitable[User]]:
+    # One checker per role set, so FastAPI's per-request dependency cache
+    # runs it once however many times a request's dependency tree asks for it
     async def role_checker(
         current_user: Annotated[User, Depends(get_current_user)],
     ) -> User:
-        if current_user.role not in roles:
+        if current_user.role not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions",
@@ -3,7 +3,7 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import JSON, UUID, BigInteger, DateTime, ForeignKey, String, Text
+from sqlalchemy import JSON, UUID, BigInteger, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,6 +23,14 @@ class Evidence(Base, UUIDMixin):
     """Evidence model - photos/videos with integrity verification."""
 
     __tablename__ = "evidence"
+    __table_args__ = (
+        Index(
+            "ix_evidence_job_captured_live",
+            "job_id",
+            text("captured_at DESC"),
+            postgresql_where=text("superseded_at IS NULL"),
+        ),
+    )
 
     # Links
     job_id: Mapped[str] = mapped_column(
@@ -1,74 +1,129 @@
 """Evidence router."""
 
+import asyncio
 from datetime import UTC, datetime
 from typing import Annotated
-from uuid import uuid4
+from urllib.parse import quote
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile, status
 from fastapi.responses import FileResponse
-from sqlalchemy import select
+from sqlalchemy import and_, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from veriqko.config import get_settings
 from veriqko.db.base import get_db
-from veriqko.dependencies import get_current_user
+from veriqko.dependencies import get_current_user, get_readonly_db
 from veriqko.evidence.models import Evidence, EvidenceType
 from veriqko.evidence.schemas import EvidenceListResponse, EvidenceResponse, EvidenceUploadResponse
-from veriqko.evidence.storage import get_storage
-from veriqko.jobs.models import Job, TestResult, TestResultStatus
+from veriqko.evidence.storage import LocalFileStorage, StoredFile, get_storage
+from veriqko.jobs.models import Job, JobStatus, TestResult, TestResultStatus
 from veriqko.users.models import User
 
 router = APIRouter(prefix="/jobs/{job_id}/evidence", tags=["evidence"])
 
+# Settings are fixed for the life of the process
+_EVIDENCE_URL = f"{get_settings().base_url}/api/v1/evidence"
+_ACCEL_REDIRECT_PREFIX = (get_settings().storage_accel_redirect_prefix or "").rstrip("/")
+_MAX_FILES_PER_UPLOAD = get_settings().storage_max_files_per_upload
+
+
+# Evidence type by MIME top-level type; anything else is a document
+_EVIDENCE_TYPES = {"image": EvidenceType.PHOTO, "video": EvidenceType.VIDEO}
+
 
 def _get_evidence_type(mime_type: str) -> EvidenceType:
     """Determine evidence type from MIME type."""
-    if mime_type.startswith("image/"):
-        return EvidenceType.PHOTO
-    elif mime_type.startswith("video/"):
-        return EvidenceType.VIDEO
-    else:
-        return EvidenceType.DOCUMENT
+    return _EVIDENCE_TYPES.get(mime_type.partition("/")[0], EvidenceType.DOCUMENT)
+
+
+async def _get_live_job_status(db: AsyncSession, job_id: str) -> tuple[str, JobStatus]:
+    """Return the canonical ID and status of a live job, or raise 404.
+
+    Uploads call this before writing anything, so a bad or unknown job_id
+    can't leave a stored file behind under its name.
+    """
+    try:
+        job_id = str(UUID(job_id))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+    job_status = await db.scalar(
+        select(Job.status).where(Job.id == job_id, Job.deleted_at.is_(None))
+    )
+    if job_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+    return job_id, job_status
+
+
+async def _get_or_create_test_result(
+    db: AsyncSession, job_id: str, step_id: str, user_id: str
+) -> TestResult:
+    """Find the result for a step, creating a pending one if it doesn't exist."""
+    tr_stmt = select(TestResult).where(
+        TestResult.job_id == job_id,
+        TestResult.test_step_id == step_id
+    )
+    result = (await db.execute(tr_stmt)).scalar_one_or_none()
+
+    if not result:
+        result = TestResult(
+            id=str(uuid4()),
+            job_id=job_id,
+            test_step_id=step_id,
+            status=TestResultStatus.PENDING,
+            performed_by_id=user_id,
+            performed_at=datetime.now(UTC),
+            notes="Auto-created via evidence upload"
+        )
+        db.add(result)
+        await db.flush()
+
+    return result
 
 
 @router.get("", response_model=list[EvidenceListResponse])
 async def list_evidence(
     job_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_readonly_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     """List all evidence for a job."""
-    # Verify job exists
-    job_stmt = select(Job).where(Job.id == job_id, Job.deleted_at.is_(None))
-    job_result = await db.execute(job_stmt)
-    job = job_result.scalar_one_or_none()
+    # One round trip: the job row anchors an outer join, so a missing job
+    # gives no rows and a job without evidence gives one row of NULLs
+    stmt = (
+        select(Job.id, Evidence)
+        .outerjoin(
+            Evidence,
+            and_(Evidence.job_id == Job.id, Evidence.superseded_at.is_(None)),
+        )
+        .where(Job.id == job_id, Job.deleted_at.is_(None))
+        .order_by(Evidence.captured_at.desc())
+    )
+    rows = (await db.execute(stmt)).all()
 
-    if not job:
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found",
         )
 
-    # Get evidence
-    stmt = (
-        select(Evidence)
-        .where(Evidence.job_id == job_id, Evidence.superseded_at.is_(None))
-        .order_by(Evidence.captured_at.desc())
-    )
-    result = await db.execute(stmt)
-    evidence_list = result.scalars().all()
-
-    settings = get_settings()
+    evidence_list = [e for _, e in rows if e is not None]
 
     return [
-        EvidenceListResponse(
+        EvidenceListResponse.model_construct(
             id=e.id,
             evidence_type=e.evidence_type.value,
             original_filename=e.original_filename,
             file_size_bytes=e.file_size_bytes,
             captured_at=e.captured_at,
-            thumbnail_url=f"{settings.base_url}/api/v1/evidence/{e.id}/thumbnail"
+            thumbnail_url=f"{_EVIDENCE_URL}/{e.id}/thumbnail"
             if e.evidence_type == EvidenceType.PHOTO
             else None,
         )
@@ -84,17 +139,6 @@ async def upload_evidence(
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     """Upload evidence for a job."""
-    # Verify job exists
-    job_stmt = select(Job).where(Job.id == job_id, Job.deleted_at.is_(None))
-    job_result = await db.execute(job_stmt)
-    job = job_result.scalar_one_or_none()
-
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found",
-        )
-
     # Validate content type
     if not file.content_type:
         raise HTTPException(
@@ -102,11 +146,12 @@ async def upload_evidence(
             detail="Content type is required",
         )
 
-    # Save file
+    job_id, job_status = await _get_live_job_status(db, job_id)
+
     storage = get_storage()
     try:
         stored = await storage.save(
-            file=file.file,
+            file=file,
             job_id=job_id,
             filename=file.filename or "unknown",
             mime_type=file.content_type,
@@ -117,36 +162,126 @@ async def upload_evidence(
             detail=str(e),
         )
 
-    # Create evidence record
+    # Every column is known here, so insert the row directly instead of going
+    # through an ORM instance and the unit of work
     now = datetime.now(UTC)
-    evidence = Evidence(
-        id=str(uuid4()),
+    evidence_type = _get_evidence_type(file.content_type)
+    original_filename = file.filename or "unknown"
+    await db.execute(
+        insert(Evidence).values(
+            id=stored.file_id,
+            job_id=job_id,
+            evidence_type=evidence_type,
+            original_filename=original_filename,
+            stored_filename=stored.stored_filename,
+            file_path=stored.relative_path,
+            file_size_bytes=stored.size_bytes,
+            mime_type=file.content_type,
+            sha256_hash=stored.sha256_hash,
+            captured_at=now,
+            captured_by_id=current_user.id,
+            stage=job_status,
+            created_at=now,
+        )
+    )
+
+    return EvidenceUploadResponse(
+        id=stored.file_id,
         job_id=job_id,
-        evidence_type=_get_evidence_type(file.content_type),
-        original_filename=file.filename or "unknown",
-        stored_filename=stored.stored_filename,
-        file_path=stored.relative_path,
+        evidence_type=evidence_type.value,
+        original_filename=original_filename,
         file_size_bytes=stored.size_bytes,
-        mime_type=file.content_type,
         sha256_hash=stored.sha256_hash,
         captured_at=now,
-        captured_by_id=current_user.id,
-        stage=job.status,
         created_at=now,
     )
-    db.add(evidence)
-    await db.flush()
 
-    return EvidenceUploadResponse(
-        id=evidence.id,
-        job_id=evidence.job_id,
-        evidence_type=evidence.evidence_type.value,
-        original_filename=evidence.original_filename,
-        file_size_bytes=evidence.file_size_bytes,
-        sha256_hash=evidence.sha256_hash,
-        captured_at=evidence.captured_at,
-        created_at=evidence.created_at,
+
+@router.post(
+    "/bulk", response_model=list[EvidenceUploadResponse], status_code=status.HTTP_201_CREATED
+)
+async def upload_evidence_bulk(
+    job_id: str,
+    files: Annotated[list[UploadFile], File(...)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)],
+) -> list[EvidenceUploadResponse]:
+    """Upload several evidence files for a job in one request."""
+    if len(files) > _MAX_FILES_PER_UPLOAD:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {_MAX_FILES_PER_UPLOAD} files per upload",
+        )
+
+    job_id, job_status = await _get_live_job_status(db, job_id)
+
+    mime_types: list[str] = []
+    for f in files:
+        if not f.content_type:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Content type is required",
+            )
+        mime_types.append(f.content_type)
+
+    # Files are written concurrently; if any is rejected, remove the ones
+    # already stored so a failed batch leaves nothing behind
+    storage = get_storage()
+    saved = await asyncio.gather(
+        *(
+            storage.save(
+                file=f,
+                job_id=job_id,
+                filename=f.filename or "unknown",
+                mime_type=mime_type,
+            )
+            for f, mime_type in zip(files, mime_types, strict=True)
+        ),
+        return_exceptions=True,
     )
+    stored_files = [s for s in saved if isinstance(s, StoredFile)]
+    failure = next((s for s in saved if isinstance(s, BaseException)), None)
+    if failure is not None:
+        await asyncio.gather(*(storage.delete(s.relative_path) for s in stored_files))
+        if isinstance(failure, ValueError):
+            raise HTTPException(status_code=400, detail=str(failure))
+        raise failure
+
+    now = datetime.now(UTC)
+    evidence_items = [
+        Evidence(
+            id=stored.file_id,
+            job_id=job_id,
+            evidence_type=_get_evidence_type(mime_type),
+            original_filename=f.filename or "unknown",
+            stored_filename=stored.stored_filename,
+            file_path=stored.relative_path,
+            file_size_bytes=stored.size_bytes,
+            mime_type=mime_type,
+            sha256_hash=stored.sha256_hash,
+            captured_at=now,
+            captured_by_id=current_user.id,
+            stage=job_status,
+            created_at=now,
+        )
+        for f, mime_type, stored in zip(files, mime_types, stored_files, strict=True)
+    ]
+    db.add_all(evidence_items)
+    await db.flush()
+
+    return [
+        EvidenceUploadResponse(
+            id=e.id,
+            job_id=e.job_id,
+            evidence_type=e.evidence_type.value,
+            original_filename=e.original_filename,
+            file_size_bytes=e.file_size_bytes,
+            sha256_hash=e.sha256_hash,
+            captured_at=e.captured_at,
+            created_at=e.created_at,
+        )
+        for e in evidence_items
+    ]
 
 
 @router.post("/steps/{step_id}", response_model=EvidenceUploadResponse, status_code=status.HTTP_201_CREATED)
@@ -165,43 +300,32 @@ async def upload_evidence_for_step(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Find or create TestResult for this step
-    tr_stmt = select(TestResult).where(
-        TestResult.job_id == job_id,
-        TestResult.test_step_id == step_id
-    )
-    result = (await db.execute(tr_stmt)).scalar_one_or_none()
-
-    if not result:
-        # Create a pending result if it doesn't exist
-        result = TestResult(
-            id=str(uuid4()),
-            job_id=job_id,
-            test_step_id=step_id,
-            status=TestResultStatus.PENDING,
-            performed_by_id=current_user.id,
-            performed_at=datetime.now(UTC),
-            notes="Auto-created via evidence upload"
-        )
-        db.add(result)
-        await db.flush()
-
-    # Save file
+    # The test result lookup and the file save are independent, so overlap
+    # them; both finish before any error is raised so the session is idle
     storage = get_storage()
-    try:
-        stored = await storage.save(
-            file=file.file,
+    result, stored = await asyncio.gather(
+        _get_or_create_test_result(db, job_id, step_id, current_user.id),
+        storage.save(
+            file=file,
             job_id=job_id,
             filename=file.filename or "unknown",
             mime_type=file.content_type,
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        ),
+        return_exceptions=True,
+    )
+    if isinstance(result, BaseException):
+        if isinstance(stored, StoredFile):
+            await storage.delete(stored.relative_path)
+        raise result
+    if isinstance(stored, ValueError):
+        raise HTTPException(status_code=400, detail=str(stored))
+    if isinstance(stored, BaseException):
+        raise stored
 
     # Create evidence record
     now = datetime.now(UTC)
     evidence = Evidence(
-        id=str(uuid4()),
+        id=stored.file_id,
         job_id=job_id,
         test_result_id=result.id,
         stage=job.status,
@@ -238,13 +362,13 @@ evidence_router = APIRouter(prefix="/evidence", tags=["evidence"])
 @evidence_router.get("/{evidence_id}")
 async def get_evidence(
     evidence_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_readonly_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     """Get evidence metadata."""
     stmt = (
         select(Evidence)
-        .options(selectinload(Evidence.captured_by))
+        .options(joinedload(Evidence.captured_by))
         .where(Evidence.id == evidence_id)
     )
     result = await db.execute(stmt)
@@ -256,8 +380,6 @@ async def get_evidence(
             detail="Evidence not found",
         )
 
-    settings = get_settings()
-
     return EvidenceResponse(
         id=evidence.id,
         job_id=evidence.job_id,
@@ -268,16 +390,32 @@ async def get_evidence(
         mime_type=evidence.mime_type,
         sha256_hash=evidence.sha256_hash,
         captured_at=evidence.captured_at,
-        captured_by_name=evidence.captured_by.full_name if evidence.captured_by else "Unknown",
+        captured_by_name=(evidence.captured_by and evidence.captured_by.full_name) or "Unknown",
         caption=evidence.caption,
-        download_url=f"{settings.base_url}/api/v1/evidence/{evidence.id}/download",
+        download_url=f"{_EVIDENCE_URL}/{evidence.id}/download",
+    )
+
+
+def _accel_redirect_response(evidence: Evidence) -> Response:
+    """Empty response telling nginx which stored file to send."""
+    filename = quote(evidence.original_filename)
+    if filename != evidence.original_filename:
+        disposition = f"attachment; filename*=utf-8''{filename}"
+    else:
+        disposition = f'attachment; filename="{evidence.original_filename}"'
+    return Response(
+        media_type=evidence.mime_type,
+        headers={
+            "X-Accel-Redirect": quote(f"{_ACCEL_REDIRECT_PREFIX}/{evidence.file_path}"),
+            "Content-Disposition": disposition,
+        },
     )
 
 
 @evidence_router.get("/{evidence_id}/download")
 async def download_evidence(
     evidence_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_readonly_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     """Download evidence file."""
@@ -292,6 +430,10 @@ async def download_evidence(
         )
 
     storage = get_storage()
+    if _ACCEL_REDIRECT_PREFIX and isinstance(storage, LocalFileStorage):
+        # nginx streams the file itself and answers 404 if it is missing
+        return _accel_redirect_response(evidence)
+
     file_path = await storage.get_path(evidence.file_path)
 
     if not await storage.exists(evidence.file_path):
@@ -366,7 +508,7 @@ async def upload_evidence_for_step(
     storage = get_storage()
     try:
         stored = await storage.save(
-            file=file.file,
+            file=file,
             job_id=job_id,
             filename=file.filename or "unknown",
             mime_type=file.content_type,
@@ -377,7 +519,7 @@ async def upload_evidence_for_step(
     # Create evidence record
     now = datetime.now(UTC)
     evidence = Evidence(
-        id=str(uuid4()),
+        id=stored.file_id,
         job_id=job_id,
         test_result_id=result.id,
         stage=stage,
@@ -1,22 +1,101 @@
 """Evidence file storage."""
 
+import asyncio
 import hashlib
+import io
+import mmap
+import os
 import re
+import shutil
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
+from tempfile import SpooledTemporaryFile
 from typing import BinaryIO
 from uuid import uuid4
 
 import aiofiles
 import aiofiles.os
+from starlette.datastructures import UploadFile
+
+# Upload read size; large blocks keep syscalls and hashing calls few
+_CHUNK_SIZE = 1 << 20
+# Anything but (Unicode) word characters, dots and hyphens
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\-.]")
+
+
+async def _read(file: BinaryIO | UploadFile, size: int = -1) -> bytes:
+    """Read from an upload without blocking the event loop, or from a plain stream."""
+    if isinstance(file, UploadFile):
+        # Offloads to a thread once the upload has spooled to disk
+        return await file.read(size)
+    return file.read(size)
+
+
+def _on_disk(file: BinaryIO | UploadFile) -> tuple[int, int] | None:
+    """File descriptor and read position of a source already on disk, if any."""
+    raw = file.file if isinstance(file, UploadFile) else file
+    # A spooled upload still in memory has no name yet, and calling fileno()
+    # on it would force it to disk
+    if isinstance(raw, SpooledTemporaryFile) and raw.name is None:
+        return None
+    try:
+        return raw.fileno(), raw.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _copy_fd(src_fd: int, dst_path: Path, offset: int, count: int) -> None:
+    """Copy a byte range into a new file, inside the kernel where possible."""
+    try:
+        with open(dst_path, "wb") as dst:
+            try:
+                position, remaining = offset, count
+                while remaining > 0:
+                    sent = os.sendfile(dst.fileno(), src_fd, position, remaining)
+                    if sent == 0:
+                        break
+                    position += sent
+                    remaining -= sent
+            except (AttributeError, OSError):
+                # No sendfile on this platform, or not between these files
+                dst.seek(0)
+                dst.truncate()
+                with open(src_fd, "rb", closefd=False) as src:
+                    src.seek(offset)
+                    shutil.copyfileobj(src, dst)
+            written = dst.tell()
+        if written != count:
+            raise OSError(f"Upload truncated: copied {written} of {count} bytes")
+    except BaseException:
+        dst_path.unlink(missing_ok=True)
+        raise
+
+
+def _sha256_fd(src_fd: int, offset: int, count: int) -> str:
+    """SHA-256 of a byte range, hashed straight from a read-only mapping."""
+    if count == 0:
+        return hashlib.sha256().hexdigest()
+    with mmap.mmap(src_fd, 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            return hashlib.sha256(view[offset:offset + count]).hexdigest()
+
+
+def _sha256_file(path: Path) -> str:
+    """SHA-256 of a file, hashed in C by OpenSSL with the GIL released."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 @dataclass
 class StoredFile:
     """Metadata about a stored file."""
 
+    # Unique id prefixed to the stored filename; callers may reuse it as the
+    # id of the row that records the file
+    file_id: str
     stored_filename: str
     relative_path: str
     absolute_path: Path | str
@@ -52,10 +131,19 @@ class StorageConfig:
 class Storage(ABC):
     """Abstract storage interface."""
 
+    config: StorageConfig
+
+    def _reject_oversized(self, file: BinaryIO | UploadFile) -> None:
+        """Refuse an upload whose size is already known before touching its bytes."""
+        # UploadFile.size is counted while the multipart body is parsed
+        size = file.size if isinstance(file, UploadFile) else None
+        if size is not None and size > self.config.max_file_size_mb * 1024 * 1024:
+            raise ValueError(f"File exceeds maximum size of {self.config.max_file_size_mb}MB")
+
     @abstractmethod
     async def save(
         self,
-        file: BinaryIO,
+        file: BinaryIO | UploadFile,
         job_id: str,
         filename: str,
         mime_type: str,
@@ -79,6 +167,15 @@ class Storage(ABC):
         """Delete a file."""
         pass
 
+    async def presigned_url(
+        self,
+        relative_path: str,
+        expires_in: int,
+        download_name: str | None = None,
+    ) -> str | None:
+        """Get a short-lived direct download URL, or None if the backend has none."""
+        return None
+
 
 class AzureBlobStorage(Storage):
     """Azure Blob Storage implementation."""
@@ -95,7 +192,7 @@ class AzureBlobStorage(Storage):
 
     async def save(
         self,
-        file: BinaryIO,
+        file: BinaryIO | UploadFile,
         job_id: str,
         filename: str,
         mime_type: str,
@@ -104,6 +201,7 @@ class AzureBlobStorage(Storage):
         # Validate mime type
         if mime_type not in self.config.allowed_mime_types:
             raise ValueError(f"Unsupported file type: {mime_type}")
+        self._reject_oversized(file)
 
         # Generate unique filename
         file_uuid = str(uuid4())
@@ -114,10 +212,7 @@ class AzureBlobStorage(Storage):
         now = datetime.now(UTC)
         blob_path = f"{folder}/{now.year}/{now.month:02d}/{job_id}/{stored_filename}"
 
-        # Calculate hash while reading
-        sha256 = hashlib.sha256()
-        content = file.read()
-        sha256.update(content)
+        content = await _read(file)
         size = len(content)
 
         # Check size limit
@@ -129,10 +224,17 @@ class AzureBlobStorage(Storage):
             container_client = client.get_container_client(self.container_name)
             blob_client = container_client.get_blob_client(blob_path)
 
-            # Simple upload for now, could be optimized for large files
-            await blob_client.upload_blob(content, overwrite=True, content_settings={"content_type": mime_type})
+            # Hash on a worker thread while the upload is on the wire; hashlib
+            # releases the GIL for large buffers
+            _, sha256 = await asyncio.gather(
+                blob_client.upload_blob(
+                    content, overwrite=True, content_settings={"content_type": mime_type}
+                ),
+                asyncio.to_thread(hashlib.sha256, content),
+            )
 
         return StoredFile(
+            file_id=file_uuid,
             stored_filename=stored_filename,
             relative_path=blob_path,
             absolute_path=blob_client.url,
@@ -163,8 +265,43 @@ class AzureBlobStorage(Storage):
                 return True
             return False
 
+    async def presigned_url(
+        self,
+        relative_path: str,
+        expires_in: int,
+        download_name: str | None = None,
+    ) -> str | None:
+        # Signing is local, so the sync client is enough and no I/O happens here
+        from azure.storage.blob import BlobClient, BlobSasPermissions, generate_blob_sas
+
+        connection_string = self.config.azure_connection_string
+        if not connection_string:
+            return None
+        blob_client = BlobClient.from_connection_string(
+            connection_string, self.container_name, relative_path
+        )
+        # Signing needs the account name and key; SAS-token connection strings
+        # have no key
+        account_name = blob_client.account_name
+        account_key = getattr(blob_client.credential, "account_key", None)
+        if not account_name or not account_key:
+            return None
+
+        sas = generate_blob_sas(
+            account_name=account_name,
+            container_name=self.container_name,
+            blob_name=relative_path,
+            account_key=account_key,
+            permission=BlobSasPermissions(read=True),
+            expiry=datetime.now(UTC) + timedelta(seconds=expires_in),
+            content_disposition=(
+                f'attachment; filename="{download_name}"' if download_name else None
+            ),
+        )
+        return f"{blob_client.url}?{sas}"
+
     def _sanitize_filename(self, filename: str) -> str:
-        safe = re.sub(r"[^\w\-.]", "_", filename)
+        safe = _UNSAFE_FILENAME_CHARS.sub("_", filename)
         if "." in safe:
             name, ext = safe.rsplit(".", 1)
             return f"{name[:50]}.{ext}"
@@ -197,7 +334,7 @@ class LocalFileStorage(Storage):
 
     async def save(
         self,
-        file: BinaryIO,
+        file: BinaryIO | UploadFile,
         job_id: str,
         filename: str,
         mime_type: str,
@@ -207,6 +344,7 @@ class LocalFileStorage(Storage):
         # Validate mime type
         if mime_type not in self.config.allowed_mime_types:
             raise ValueError(f"Unsupported file type: {mime_type}")
+        self._reject_oversized(file)
 
         # Generate unique filename
         file_uuid = str(uuid4())
@@ -222,21 +360,43 @@ class LocalFileStorage(Storage):
         # Ensure directory exists
         await aiofiles.os.makedirs(absolute_path.parent, exist_ok=True)
 
-        # Calculate hash while writing
-        sha256 = hashlib.sha256()
+        max_size = self.config.max_file_size_mb * 1024 * 1024
+
+        source = _on_disk(file)
+        if source is not None:
+            # Uploads that spooled to disk are copied kernel-side while the
+            # hash is taken from a mapping of the same bytes
+            src_fd, offset = source
+            size = os.fstat(src_fd).st_size - offset
+            if size > max_size:
+                raise ValueError(
+                    f"File exceeds maximum size of {self.config.max_file_size_mb}MB"
+                )
+            _, sha256_hash = await asyncio.gather(
+                asyncio.to_thread(_copy_fd, src_fd, absolute_path, offset, size),
+                asyncio.to_thread(_sha256_fd, src_fd, offset, size),
+            )
+            return StoredFile(
+                file_id=file_uuid,
+                stored_filename=stored_filename,
+                relative_path=str(relative_path),
+                absolute_path=absolute_path,
+                size_bytes=size,
+                sha256_hash=sha256_hash,
+                mime_type=mime_type,
+            )
+
         size = 0
 
         async with aiofiles.open(absolute_path, "wb") as f:
             while True:
-                chunk = file.read(8192)
+                chunk = await _read(file, _CHUNK_SIZE)
                 if not chunk:
                     break
 
-                sha256.update(chunk)
                 size += len(chunk)
 
                 # Check size limit
-                max_size = self.config.max_file_size_mb * 1024 * 1024
                 if size > max_size:
                     await aiofiles.os.remove(absolute_path)
                     raise ValueError(
@@ -245,12 +405,17 @@ class LocalFileStorage(Storage):
 
                 await f.write(chunk)
 
+        # Hash the written file in one C-level pass on a worker thread rather
+        # than chunk by chunk on the event loop; it is still in the page cache
+        sha256_hash = await asyncio.to_thread(_sha256_file, absolute_path)
+
         return StoredFile(
+            file_id=file_uuid,
             stored_filename=stored_filename,
             relative_path=str(relative_path),
             absolute_path=absolute_path,
             size_bytes=size,
-            sha256_hash=sha256.hexdigest(),
+            sha256_hash=sha256_hash,
             mime_type=mime_type,
         )
 
@@ -278,7 +443,7 @@ class LocalFileStorage(Storage):
     def _sanitize_filename(self, filename: str) -> str:
         """Remove unsafe characters from filename."""
         # Keep only alphanumeric, dots, hyphens, underscores
-        safe = re.sub(r"[^\w\-.]", "_", filename)
+        safe = _UNSAFE_FILENAME_CHARS.sub("_", filename)
 
         # Limit length
         if "." in safe:
@@ -287,8 +452,9 @@ class LocalFileStorage(Storage):
         return safe[:50]
 
 
+@lru_cache(maxsize=1)
 def get_storage() -> Storage:
-    """Get storage instance based on settings."""
+    """Get the storage instance for the configured backend (built once)."""
     from veriqko.config import get_settings
 
     settings = get_settings()
@@ -1,31 +1,44 @@
-
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
+from pydantic_core import to_json
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from veriqko.cache import TTLCache
+from veriqko.config import get_settings
 from veriqko.db.base import get_db
 
 router = APIRouter(tags=["system"])
 
+# The healthy answer never changes, so serialize it once
+_HEALTHY_BODY = to_json({
+    "status": "healthy",
+    "database": "connected",
+    "version": "v2.1.0"
+})
+# Load balancers poll this constantly; reuse a recent successful ping
+_db_check: TTLCache[str, bool] = TTLCache(
+    get_settings().health_db_check_ttl_seconds, max_entries=1
+)
+
 @router.get("/health", status_code=status.HTTP_200_OK)
 async def health_check(db: AsyncSession = Depends(get_db)):
     """
     System health check.
     Verifies API is running and Database connection is active.
     """
-    health_status = {
-        "status": "healthy",
-        "database": "unknown",
-        "version": "v2.1.0"
-    }
+    if _db_check.get("db"):
+        return Response(content=_HEALTHY_BODY, media_type="application/json")
 
     try:
         # Check DB connection
         await db.execute(text("SELECT 1"))
-        health_status["database"] = "connected"
     except Exception as e:
-        health_status["status"] = "degraded"
-        health_status["database"] = "unreachable"
-        health_status["error"] = str(e)
+        return {
+            "status": "degraded",
+            "database": "unreachable",
+            "version": "v2.1.0",
+            "error": str(e),
+        }
 
-    return health_status
+    _db_check.set("db", True)
+    return Response(content=_HEALTHY_BODY, media_type="application/json")
@@ -1,6 +1,17 @@
 import uuid
 
-from sqlalchemy import JSON, UUID, Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import (
+    JSON,
+    UUID,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    text,
+)
 from sqlalchemy.orm import relationship
 
 from veriqko.db.base import Base
@@ -8,6 +19,15 @@ from veriqko.db.base import Base
 
 class ApiKey(Base):
     __tablename__ = "api_keys"
+    __table_args__ = (
+        # Key authentication only ever looks up active keys by hash
+        Index(
+            "ix_api_keys_hashed_key_active",
+            "hashed_key",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)  # e.g. "ERP System"
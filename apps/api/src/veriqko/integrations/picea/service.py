@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from veriqko.config import get_settings
 from veriqko.integrations.picea.client import PiceaClient
+from veriqko.jobs.cache import job_cache
 from veriqko.jobs.models import Job, TestResult, TestResultStatus, TestStep
 
 logger = structlog.get_logger(__name__)
@@ -116,6 +117,7 @@ class PiceaService:
                 )
 
         await self.session.commit()
+        job_cache.invalidate(job.id)
         return True
 
     async def _upsert_test_result(
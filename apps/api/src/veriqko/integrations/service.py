@@ -18,11 +18,11 @@ class KeyGenerator:
         """
         random_part = secrets.token_urlsafe(32)
         raw_key = f"vq_live_{random_part}"
-        hashed_key = hashlib.sha256(raw_key.encode()).hexdigest()
-        return raw_key, hashed_key
+        return raw_key, KeyGenerator.hash_key(raw_key)
 
     @staticmethod
     def hash_key(raw_key: str) -> str:
+        # hashlib dispatches to OpenSSL's native SHA-256 (SHA-NI where available)
         return hashlib.sha256(raw_key.encode()).hexdigest()
 
 class IntegrationService:
@@ -48,10 +48,12 @@ class IntegrationService:
     async def get_api_key_by_hash(self, hashed_key: str) -> ApiKey | None:
         """Retrieves an active API Key by its hash."""
         result = await self.session.execute(
-            select(ApiKey).where(
+            select(ApiKey)
+            .where(
                 ApiKey.hashed_key == hashed_key,
                 ApiKey.is_active == True
             )
+            .limit(1)
         )
         return result.scalars().first()
 
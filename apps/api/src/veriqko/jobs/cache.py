@@ -0,0 +1,41 @@
+"""Per-process cache for job detail reads."""
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from veriqko.cache import TTLCache
+from veriqko.config import get_settings
+from veriqko.jobs.models import Job
+
+# Session.info key collecting the ids of jobs written in the open transaction
+_CHANGED_JOBS = "changed_job_ids"
+
+
+# Detached, fully loaded jobs keyed by id. Job writes in this process drop
+# their entry once they commit; other processes see the change once their
+# entries expire.
+_settings = get_settings()
+job_cache: TTLCache[str, Job] = TTLCache(
+    _settings.job_cache_ttl_seconds, _settings.job_cache_max_entries
+)
+
+
+def mark_job_changed(session: AsyncSession | Session, job_id: str) -> None:
+    """Drop ``job_id`` from the cache once ``session`` commits.
+
+    Invalidating before the commit would let a concurrent read cache the old
+    row again until the TTL runs out.
+    """
+    session.info.setdefault(_CHANGED_JOBS, set()).add(job_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_jobs(session: Session) -> None:
+    for job_id in session.info.pop(_CHANGED_JOBS, ()):
+        job_cache.invalidate(job_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_jobs(session: Session) -> None:
+    session.info.pop(_CHANGED_JOBS, None)
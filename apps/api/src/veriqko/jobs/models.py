@@ -39,8 +39,53 @@ class Job(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
 
     __tablename__ = "jobs"
     __table_args__ = (
-        sa.Index("ix_jobs_status_created_at", "status", "created_at"),
+        sa.Index(
+            "ix_jobs_active_created_at",
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+            postgresql_include=["status", "assigned_technician_id", "customer_reference"],
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        sa.Index(
+            "ix_jobs_active_technician_created_at",
+            "assigned_technician_id",
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        sa.Index(
+            "ix_jobs_active_status_created_at",
+            "status",
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        sa.Index(
+            "ix_jobs_sla_open",
+            "sla_due_at",
+            postgresql_where=sa.text(
+                "deleted_at IS NULL AND sla_breach_notified_at IS NULL "
+                "AND status NOT IN ('completed', 'failed')"
+            ),
+        ),
+        sa.Index("ix_jobs_station_updated_at", "current_station_id", "updated_at"),
+        sa.Index(
+            "ix_jobs_completed_at_technician",
+            "completed_at",
+            postgresql_include=["assigned_technician_id"],
+            postgresql_where=sa.text("deleted_at IS NULL AND status = 'completed'"),
+        ),
+        sa.Index(
+            "ix_jobs_open_station",
+            "current_station_id",
+            postgresql_where=sa.text(
+                "deleted_at IS NULL AND status NOT IN ('completed', 'failed')"
+            ),
+        ),
     )
+    # Fetch created_at/updated_at via RETURNING on flush so written jobs can be
+    # serialized without a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     # Device reference
     device_id: Mapped[str | None] = mapped_column(
@@ -165,6 +210,16 @@ class TestResult(Base, UUIDMixin, TimestampMixin):
     """Test result - job-specific test execution record."""
 
     __tablename__ = "test_results"
+    __table_args__ = (
+        sa.Index(
+            "ix_test_results_failed",
+            "job_id",
+            "test_step_id",
+            postgresql_where=sa.text("status = 'fail'"),
+        ),
+        # One result per step per job; result submission upserts on it
+        sa.Index("ux_test_results_job_step", "job_id", "test_step_id", unique=True),
+    )
 
     job_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -1,16 +1,21 @@
 """Job router."""
 
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from datetime import UTC, datetime
-from typing import Annotated
+from typing import Annotated, Any
+from uuid import UUID
 
 import fastapi
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
+from pydantic_core import to_json
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from veriqko.db.base import get_db
 from veriqko.dependencies import get_current_user
+from veriqko.jobs.models import Job, JobStatus, TestResult, TestStep
 from veriqko.jobs.schemas import (
     EvidenceSummary,
     JobBatchCreate,
@@ -25,6 +30,7 @@ from veriqko.jobs.schemas import (
     TransitionResponse,
 )
 from veriqko.jobs.service import JobService
+from veriqko.templates.cache import step_template_cache
 from veriqko.users.models import User
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
@@ -85,6 +91,22 @@ def _job_to_response(job) -> JobResponse:
     )
 
 
+def _encode_cursor(created_at: datetime, job_id: str) -> str:
+    """Opaque list cursor pointing just past the given row."""
+    return urlsafe_b64encode(f"{created_at.isoformat()}|{job_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        created_at, job_id = urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), str(UUID(job_id))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
 @router.get("", response_model=list[JobListResponse])
 async def list_jobs(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -94,33 +116,37 @@ async def list_jobs(
     search: str | None = Query(None),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="X-Next-Cursor from the previous page"),
 ):
-    """List jobs with optional filtering."""
+    """List jobs with optional filtering.
+
+    When more rows follow, the X-Next-Cursor header holds the cursor for the
+    next page; paging by cursor stays fast however deep it goes, unlike offset.
+    """
     service = JobService(db)
-    jobs = await service.list(
+    # One extra row tells whether there is a next page
+    rows = await service.list_summaries(
         status=status,
         technician_id=technician_id,
         search=search,
-        limit=limit,
+        limit=limit + 1,
         offset=offset,
         current_user=current_user,
+        after=_decode_cursor(cursor) if cursor else None,
+    )
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = _encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    # The rows already have exactly the JobListResponse fields, so serialize
+    # them straight to JSON bytes instead of building a model per row and
+    # having FastAPI validate and dump each one again.
+    return Response(
+        content=to_json([row._asdict() for row in rows]),
+        media_type="application/json",
+        headers=headers,
     )
-
-    return [
-        JobListResponse(
-            id=job.id,
-            serial_number=job.serial_number,
-            status=job.status.value,
-            device_brand=job.device.brand.name if job.device else None,
-            device_type=job.device.gadget_type.name if job.device else None,
-            device_model=job.device.model if job.device else None,
-            assigned_technician_name=job.assigned_technician.full_name
-            if job.assigned_technician
-            else None,
-            created_at=job.created_at,
-        )
-        for job in jobs
-    ]
 
 
 @router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
@@ -201,6 +227,7 @@ async def update_job(
 async def transition_job(
     job_id: str,
     data: JobTransition,
+    background_tasks: BackgroundTasks,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ):
@@ -214,6 +241,7 @@ async def transition_job(
         notes=data.notes,
         is_fully_tested=data.is_fully_tested,
         skip_reason=data.reason,
+        background_tasks=background_tasks,
     )
 
     if job is None:
@@ -231,6 +259,9 @@ async def transition_job(
             },
         )
 
+    # Release the job row before background tasks write to it
+    await db.commit()
+
     return TransitionResponse(
         job=_job_to_response(job),
         from_status=result.from_status.value,
@@ -264,7 +295,7 @@ async def get_job_history(
             id=h.id,
             from_status=h.from_status.value if h.from_status else None,
             to_status=h.to_status.value,
-            changed_by_name=h.changed_by.full_name if h.changed_by else "Unknown",
+            changed_by_name=h.changed_by_name or "Unknown",
             changed_at=h.changed_at,
             notes=h.notes,
         )
@@ -291,6 +322,61 @@ async def get_valid_transitions(
     return service.get_valid_transitions(job)
 
 
+# Template columns kept in the step template cache
+_STEP_COLUMNS = (
+    TestStep.id,
+    TestStep.name,
+    TestStep.description,
+    TestStep.sequence_order,
+    TestStep.is_mandatory,
+    TestStep.requires_evidence,
+)
+_STEP_KEYS = tuple(column.key for column in _STEP_COLUMNS)
+
+
+async def _get_steps_with_results(
+    db: AsyncSession, job_id: str, device_id: str, station_type: JobStatus
+) -> tuple[list[dict[str, Any]], dict[str, TestResult]]:
+    """Get a device's test steps for one station, in display order, and the
+    job's results for them keyed by step ID.
+
+    A warm template cache leaves only the results query. On a miss the steps
+    come back outer-joined to this job's results (a job has at most one result
+    per step) and refill the cache.
+    """
+    key = (device_id, station_type)
+    steps = step_template_cache.get(key)
+    if steps is not None:
+        if not steps:
+            return steps, {}
+        stmt_results = (
+            select(TestResult)
+            .options(selectinload(TestResult.evidence_items))
+            .where(TestResult.job_id == job_id)
+        )
+        results = (await db.execute(stmt_results)).scalars()
+        return steps, {r.test_step_id: r for r in results}
+
+    stmt = (
+        select(*_STEP_COLUMNS, TestResult)
+        .outerjoin(
+            TestResult,
+            and_(TestResult.test_step_id == TestStep.id, TestResult.job_id == job_id),
+        )
+        .options(selectinload(TestResult.evidence_items))
+        .where(TestStep.device_id == device_id, TestStep.station_type == station_type)
+        .order_by(TestStep.sequence_order)
+    )
+    steps = []
+    results_map: dict[str, TestResult] = {}
+    for *values, result in (await db.execute(stmt)).all():
+        step = dict(zip(_STEP_KEYS, values, strict=True))
+        steps.append(step)
+        if result is not None:
+            results_map[result.test_step_id] = result
+    return step_template_cache.set(key, steps), results_map
+
+
 @router.get("/{job_id}/steps", response_model=list[TestStepResponse])
 async def get_job_steps(
     job_id: str,
@@ -300,23 +386,17 @@ async def get_job_steps(
     """Get workflow steps with current status for the job."""
     # Logic:
     # 1. Get Job -> get current_station_id (or status to infer station type)
-    # 2. Get TestSteps for device_id + station_type
-    # 3. Get TestResults for job_id
-    # 4. Merge
+    # 2. Get TestSteps for device_id + station_type (cached per process)
+    #    and this job's TestResults for them
+    # 3. Merge
 
     # Ideally this logic belongs in Service, but implementing here for brevity/speed as per constraints
-    from veriqko.jobs.models import Job, JobStatus, TestResult, TestStep
 
-    # Get Job with session.get but we need relationships
-    stmt = (
-        select(Job)
-        .options(
-            selectinload(Job.device).selectinload(Device.brand),
-            selectinload(Job.device).selectinload(Device.gadget_type)
-        )
-        .where(Job.id == job_id, Job.deleted_at.is_(None))
+    # Only device_id and status are needed here
+    stmt = select(Job.device_id, Job.status).where(
+        Job.id == job_id, Job.deleted_at.is_(None)
     )
-    job = (await db.execute(stmt)).scalar_one_or_none()
+    job = (await db.execute(stmt)).first()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -334,26 +414,14 @@ async def get_job_steps(
     if display_stage not in [JobStatus.INTAKE, JobStatus.RESET, JobStatus.FUNCTIONAL, JobStatus.QC]:
         return []
 
-    # Get Steps
-    stmt = select(TestStep).where(
-        TestStep.device_id == job.device_id,
-        TestStep.station_type == display_stage
-    ).order_by(TestStep.sequence_order)
-    steps = (await db.execute(stmt)).scalars().all()
-
-    from sqlalchemy.orm import selectinload
-    stmt_results = (
-        select(TestResult)
-        .options(selectinload(TestResult.evidence_items))
-        .where(TestResult.job_id == job_id)
-    )
-    results = (await db.execute(stmt_results)).scalars().all()
-    results_map = {r.test_step_id: r for r in results}
+    if job.device_id is None:
+        return []
+    steps, results_map = await _get_steps_with_results(db, job_id, job.device_id, display_stage)
 
     # Build response
     response = []
     for step in steps:
-        result = results_map.get(step.id)
+        result = results_map.get(step["id"])
 
         evidence_list = []
         if result:
@@ -367,12 +435,7 @@ async def get_job_steps(
             ]
 
         response.append(TestStepResponse(
-            id=step.id,
-            name=step.name,
-            description=step.description,
-            sequence_order=step.sequence_order,
-            is_mandatory=step.is_mandatory,
-            requires_evidence=step.requires_evidence,
+            **step,
             status=result.status.value if result else "pending",
             notes=result.notes if result else None,
             evidence=evidence_list
@@ -390,32 +453,29 @@ async def submit_step_result(
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     """Submit a test result."""
-    from datetime import datetime
-
     from veriqko.jobs.models import TestResult, TestResultStatus
 
-    # Check if result exists
-    stmt = select(TestResult).where(
-        TestResult.job_id == job_id,
-        TestResult.test_step_id == step_id
+    # Single atomic upsert on (job_id, test_step_id); two submissions for the
+    # same step cannot both take the INSERT path
+    insert_stmt = pg_insert(TestResult).values(
+        job_id=job_id,
+        test_step_id=step_id,
+        status=TestResultStatus(data.status),
+        performed_by_id=current_user.id,
+        performed_at=func.now(),
+        notes=data.notes,
     )
-    result = (await db.execute(stmt)).scalar_one_or_none()
-
-    if result:
-        result.status = TestResultStatus(data.status)
-        result.notes = data.notes
-        result.performed_at = datetime.now(UTC)
-        result.performed_by_id = current_user.id
-    else:
-        result = TestResult(
-            job_id=job_id,
-            test_step_id=step_id,
-            status=TestResultStatus(data.status),
-            performed_by_id=current_user.id,
-            performed_at=datetime.now(UTC),
-            notes=data.notes
-        )
-        db.add(result)
+    stmt = insert_stmt.on_conflict_do_update(
+        index_elements=[TestResult.job_id, TestResult.test_step_id],
+        set_={
+            "status": insert_stmt.excluded.status,
+            "notes": insert_stmt.excluded.notes,
+            "performed_by_id": insert_stmt.excluded.performed_by_id,
+            "performed_at": func.now(),
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
 
     await db.commit()
     return {"status": "success"}
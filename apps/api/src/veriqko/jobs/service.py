@@ -2,17 +2,97 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import asyncio
+import builtins
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
 from uuid import uuid4
 
-from sqlalchemy import String, or_, select
+from fastapi import BackgroundTasks, HTTPException
+from sqlalchemy import (
+    Row,
+    Select,
+    Table,
+    Text,
+    bindparam,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-
-from veriqko.devices.models import Device
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+
+# Registers every mapped class; the module-level loader options below
+# configure the mappers as soon as this module is imported
+import veriqko.models  # noqa: F401
+from veriqko.devices.models import Brand, Device, GadgetType
+from veriqko.enums import UserRole
+from veriqko.evidence.models import Evidence
+from veriqko.integrations.email import email_service
+from veriqko.integrations.gsma import gsma_client
+from veriqko.integrations.miradore import miradore_client
+from veriqko.integrations.picea.service import PiceaService
+from veriqko.jobs.cache import job_cache, mark_job_changed
 from veriqko.jobs.models import Job, JobHistory, JobStatus
 from veriqko.jobs.schemas import JobBatchCreate, JobCreate, JobUpdate
 from veriqko.jobs.state_machine import JobStateMachine, TransitionResult
+from veriqko.jobs.tasks import sync_picea_diagnostics
+from veriqko.stats.cache import stats_cache
+from veriqko.users.models import User
+
+# Core tables for the batch insert, which bypasses the unit of work
+_job_table = cast(Table, Job.__table__)
+_job_history_table = cast(Table, JobHistory.__table__)
+
+# Relationships rendered by the job detail response, for statements that load
+# several jobs at once (joined loads don't apply to from_statement)
+_JOB_DETAIL_OPTIONS = (
+    selectinload(Job.device).selectinload(Device.brand),
+    selectinload(Job.device).selectinload(Device.gadget_type),
+    selectinload(Job.assigned_technician),
+    selectinload(Job.current_station),
+    selectinload(Job.qc_technician),
+)
+
+# Built once so every lookup hits SQLAlchemy's compiled cache and issues
+# byte-identical SQL, which lets asyncpg reuse its prepared statement. The
+# to-one relationships ride along in the job row rather than costing one
+# SELECT ... IN per relationship.
+_GET_JOB_STMT = (
+    select(Job)
+    .options(
+        joinedload(Job.device).joinedload(Device.brand),
+        joinedload(Job.device).joinedload(Device.gadget_type),
+        joinedload(Job.assigned_technician),
+        joinedload(Job.current_station),
+        joinedload(Job.qc_technician),
+    )
+    .where(Job.id == bindparam("job_id"), Job.deleted_at.is_(None))
+)
+
+# Timestamp fields stamped when a job enters each status
+_STATUS_TIMESTAMP_UPDATES: dict[JobStatus, tuple[str, ...]] = {
+    JobStatus.RESET: ("intake_completed_at", "reset_started_at"),
+    JobStatus.FUNCTIONAL: ("reset_completed_at", "functional_started_at"),
+    JobStatus.QC: ("functional_completed_at", "qc_started_at"),
+    JobStatus.COMPLETED: ("qc_completed_at", "completed_at"),
+}
+
+# Relationships JobRepository.list can load on request, keyed by include name
+_LIST_INCLUDE_OPTIONS = {
+    "device": selectinload(Job.device),
+    "device.brand": selectinload(Job.device).selectinload(Device.brand),
+    "device.gadget_type": selectinload(Job.device).selectinload(Device.gadget_type),
+    "assigned_technician": selectinload(Job.assigned_technician),
+    "current_station": selectinload(Job.current_station),
+    "qc_technician": selectinload(Job.qc_technician),
+}
 
 
 class JobRepository:
@@ -23,18 +103,7 @@ class JobRepository:
 
     async def get(self, job_id: str) -> Job | None:
         """Get a job by ID with relationships."""
-        stmt = (
-            select(Job)
-            .options(
-                selectinload(Job.device).selectinload(Device.brand),
-                selectinload(Job.device).selectinload(Device.gadget_type),
-                selectinload(Job.assigned_technician),
-                selectinload(Job.current_station),
-                selectinload(Job.qc_technician),
-            )
-            .where(Job.id == job_id, Job.deleted_at.is_(None))
-        )
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(_GET_JOB_STMT, {"job_id": job_id})
         return result.scalar_one_or_none()
 
     async def list(
@@ -45,20 +114,95 @@ class JobRepository:
         limit: int = 50,
         offset: int = 0,
         current_user: User | None = None,
-    ) -> list[Job]:
-        """List jobs with optional filtering."""
-        from veriqko.enums import UserRole
+        include: set[str] | None = None,
+        after: tuple[datetime, str] | None = None,
+    ) -> builtins.list[Job]:
+        """List jobs with optional filtering.
+
+        Relationships are only loaded when named in ``include`` (see
+        ``_LIST_INCLUDE_OPTIONS``); touching any other relationship on the
+        returned jobs raises instead of silently issuing one query per row.
+        """
+        stmt = select(Job).options(
+            *(_LIST_INCLUDE_OPTIONS[name] for name in include or ()),
+            raiseload("*"),
+        )
+        stmt = self._filter_list(
+            stmt, status, technician_id, search, limit, offset, current_user, after
+        )
+
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def list_summaries(
+        self,
+        status: JobStatus | None = None,
+        technician_id: str | None = None,
+        search: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        current_user: User | None = None,
+        after: tuple[datetime, str] | None = None,
+    ) -> builtins.list[Row[*tuple[Any, ...]]]:
+        """List the columns shown in the job table as plain rows.
 
+        Device and technician names are joined into the same query, so no
+        ORM instances or relationship loads are involved.
+        """
         stmt = (
-            select(Job)
-            .options(
-                selectinload(Job.device).selectinload(Device.brand),
-                selectinload(Job.device).selectinload(Device.gadget_type),
-                selectinload(Job.assigned_technician)
+            select(
+                Job.id,
+                Job.serial_number,
+                Job.status,
+                Job.customer_reference,
+                Job.created_at,
+                Brand.name.label("device_brand"),
+                GadgetType.name.label("device_type"),
+                Device.model.label("device_model"),
+                User.full_name.label("assigned_technician_name"),
             )
-            .where(Job.deleted_at.is_(None))
-            .order_by(Job.created_at.desc())
+            .select_from(Job)
+            .outerjoin(Device, Job.device_id == Device.id)
+            .outerjoin(Brand, Device.brand_id == Brand.id)
+            .outerjoin(GadgetType, Device.type_id == GadgetType.id)
+            .outerjoin(User, Job.assigned_technician_id == User.id)
+        )
+        stmt = self._filter_list(
+            stmt, status, technician_id, search, limit, offset, current_user, after
+        )
+
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+    def _filter_list(
+        self,
+        stmt: Select[*tuple[Any, ...]],
+        status: JobStatus | None,
+        technician_id: str | None,
+        search: str | None,
+        limit: int,
+        offset: int,
+        current_user: User | None,
+        after: tuple[datetime, str] | None = None,
+    ) -> Select[*tuple[Any, ...]]:
+        """Apply the shared job list filters, ordering and paging.
+
+        ``after`` is the (created_at, id) of the last row of the previous page;
+        paging from it is an index seek, however deep the page.
+        """
+
+        stmt = stmt.where(Job.deleted_at.is_(None)).order_by(
+            Job.created_at.desc(), Job.id.desc()
         )
+        if after is not None:
+            after_created_at, after_id = after
+            stmt = stmt.where(
+                tuple_(Job.created_at, Job.id)
+                < tuple_(
+                    literal(after_created_at, Job.created_at.type),
+                    literal(after_id, Job.id.type),
+                )
+            )
 
         # Customer filtering
         if current_user and current_user.role == UserRole.CUSTOMER:
@@ -77,7 +221,9 @@ class JobRepository:
                     Job.serial_number.ilike(search_term),
                     Job.batch_id.ilike(search_term),
                     Job.customer_reference.ilike(search_term),
-                    Job.ticket_id.cast(String).ilike(search_term),
+                    # Cast to text, matching the expression ix_jobs_ticket_id_trgm
+                    # is built on; a varchar cast wouldn't use the index
+                    Job.ticket_id.cast(Text).ilike(search_term),
                 )
             )
 
@@ -86,31 +232,31 @@ class JobRepository:
         if offset:
             stmt = stmt.offset(offset)
 
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
-
-    async def _get_next_ticket_id(self) -> int:
-        """Get the next sequential ticket ID."""
-        from sqlalchemy import func
-        stmt = select(func.max(Job.ticket_id))
-        max_id = await self.db.scalar(stmt)
-        return (max_id or 10000) + 1
+        return stmt
 
     async def create(self, data: JobCreate, user_id: str) -> Job:
         """Create a new job."""
         if data.imei:
-            from veriqko.integrations.gsma import gsma_client
-            from fastapi import HTTPException
             is_blacklisted = await gsma_client.check_imei_blacklist(data.imei)
             if is_blacklisted:
                 raise HTTPException(status_code=400, detail="Device IMEI is blacklisted by GSMA")
 
         now = datetime.now(UTC)
-        ticket_id = await self._get_next_ticket_id()
-        from datetime import timedelta
+
+        # Resolve the response relationships up front instead of re-selecting
+        # the job after the insert. The technician is the requesting user, who
+        # is already in this session's identity map.
+        device = None
+        if data.device_id:
+            device = await self.db.get(
+                Device,
+                data.device_id,
+                options=[selectinload(Device.brand), selectinload(Device.gadget_type)],
+            )
+        technician = await self.db.get(User, user_id)
+
         job = Job(
             id=str(uuid4()),
-            ticket_id=ticket_id,
             device_id=data.device_id,
             serial_number=data.serial_number,
             imei=data.imei,
@@ -121,6 +267,10 @@ class JobRepository:
             assigned_technician_id=user_id,
             intake_started_at=now,
             sla_due_at=now + timedelta(hours=24), # Default 24h SLA
+            device=device,
+            assigned_technician=technician,
+            current_station=None,
+            qc_technician=None,
         )
         self.db.add(job)
         await self.db.flush()
@@ -137,22 +287,24 @@ class JobRepository:
         )
         self.db.add(history)
         await self.db.flush()
+        stats_cache.clear()
 
-        return await self.get(job.id)
+        return job
 
-    async def create_batch(self, data: JobBatchCreate, user_id: str) -> list[Job]:
+    async def create_batch(self, data: JobBatchCreate, user_id: str) -> builtins.list[Job]:
         """Create multiple jobs."""
         now = datetime.now(UTC)
-        start_ticket_id = await self._get_next_ticket_id()
-        jobs = []
+        rows = []
 
+        # Values shared by every job in the batch
         common = data.common_data or {}
         device_id = common.get("device_id")
+        imei = common.get("imei")
+        customer_reference = data.customer_reference or common.get("customer_reference")
+        batch_id = data.batch_id or common.get("batch_id")
+        intake_condition = common.get("intake_condition")
 
-        from veriqko.integrations.gsma import gsma_client
-        from fastapi import HTTPException
-
-        for i, sn in enumerate(data.serial_numbers):
+        for sn in data.serial_numbers:
             # In a batch context, we usually do not have distinct IMEIs provided in the serial_numbers list 
             # unless SN is used as IMEI. We will assume serial_numbers could be IMEI for the sake of the GSMA check
             # if the device is a phone. To be safe, we just check SN against GSMA if it looks like an IMEI (15 digits).
@@ -160,38 +312,55 @@ class JobRepository:
                 is_blacklisted = await gsma_client.check_imei_blacklist(sn)
                 if is_blacklisted:
                     raise HTTPException(status_code=400, detail=f"Device with IMEI {sn} is blacklisted by GSMA")
-            job = Job(
-                id=str(uuid4()),
-                ticket_id=start_ticket_id + i,
-                device_id=device_id,
-                serial_number=sn,
-                imei=common.get("imei"),
-                customer_reference=data.customer_reference or common.get("customer_reference"),
-                batch_id=data.batch_id or common.get("batch_id"),
-                intake_condition=common.get("intake_condition"),
-                status=JobStatus.INTAKE,
-                assigned_technician_id=user_id,
-                intake_started_at=now,
-            )
-            self.db.add(job)
-            jobs.append(job)
-
-        await self.db.flush()
-
-        # Create history entries
-        for job in jobs:
-            history = JobHistory(
-                id=str(uuid4()),
-                job_id=job.id,
-                from_status=None,
-                to_status=JobStatus.INTAKE,
-                changed_by_id=user_id,
-                changed_at=now,
-                notes="Job created (Batch)",
+            rows.append({
+                "id": str(uuid4()),
+                "device_id": device_id,
+                "serial_number": sn,
+                "imei": imei,
+                "customer_reference": customer_reference,
+                "batch_id": batch_id,
+                "intake_condition": intake_condition,
+                "status": JobStatus.INTAKE,
+                "assigned_technician_id": user_id,
+                "intake_started_at": now,
+            })
+
+        # Jobs and their history rows go out as a single statement: the history
+        # INSERT reads the new job ids from a data-modifying CTE and the outer
+        # SELECT hands the inserted rows back to the ORM. ticket_id is drawn
+        # from the column's identity sequence by the database.
+        inserted_jobs = (
+            insert(_job_table)
+            .values(rows)
+            .returning(*_job_table.c)
+            .cte("inserted_jobs")
+        )
+        history_rows = (
+            insert(_job_history_table)
+            .from_select(
+                ["id", "job_id", "to_status", "changed_by_id", "changed_at", "notes"],
+                select(
+                    func.gen_random_uuid(),
+                    inserted_jobs.c.id,
+                    inserted_jobs.c.status,
+                    inserted_jobs.c.assigned_technician_id,
+                    inserted_jobs.c.intake_started_at,
+                    literal("Job created (Batch)"),
+                ),
             )
-            self.db.add(history)
+            .cte("job_history_rows")
+        )
+        stmt = (
+            select(Job)
+            .from_statement(select(inserted_jobs).add_cte(history_rows))
+            .options(*_JOB_DETAIL_OPTIONS)
+        )
+        jobs = list((await self.db.scalars(stmt)).all())
 
-        await self.db.flush()
+        # RETURNING order isn't guaranteed; keep the order of serial_numbers
+        position = {row["id"]: i for i, row in enumerate(rows)}
+        jobs.sort(key=lambda job: position[job.id])
+        stats_cache.clear()
         return jobs
 
     async def update(self, job_id: str, data: JobUpdate) -> Job | None:
@@ -205,7 +374,9 @@ class JobRepository:
             setattr(job, field, value)
 
         await self.db.flush()
-        return await self.get(job_id)
+        mark_job_changed(self.db, job_id)
+        stats_cache.clear()
+        return job
 
     async def update_status(
         self,
@@ -215,9 +386,14 @@ class JobRepository:
         notes: str | None = None,
         is_fully_tested: bool = True,
         skip_reason: str | None = None,
+        job: Job | None = None,
     ) -> Job | None:
-        """Update job status and record history."""
-        job = await self.get(job_id)
+        """Update job status and record history.
+
+        Pass the already-loaded ``job`` to skip re-fetching it.
+        """
+        if job is None:
+            job = await self.get(job_id)
         if not job:
             return None
 
@@ -230,19 +406,9 @@ class JobRepository:
         if skip_reason:
             job.skip_reason = skip_reason
 
-        # Update relevant timestamp
-        if status == JobStatus.RESET:
-            job.intake_completed_at = now
-            job.reset_started_at = now
-        elif status == JobStatus.FUNCTIONAL:
-            job.reset_completed_at = now
-            job.functional_started_at = now
-        elif status == JobStatus.QC:
-            job.functional_completed_at = now
-            job.qc_started_at = now
-        elif status == JobStatus.COMPLETED:
-            job.qc_completed_at = now
-            job.completed_at = now
+        # Update relevant timestamps
+        for field in _STATUS_TIMESTAMP_UPDATES.get(status, ()):
+            setattr(job, field, now)
 
         # Create history entry
         history = JobHistory(
@@ -256,19 +422,28 @@ class JobRepository:
         )
         self.db.add(history)
         await self.db.flush()
+        mark_job_changed(self.db, job_id)
+        stats_cache.clear()
 
-        return await self.get(job_id)
+        return job
 
-    async def get_history(self, job_id: str) -> list[JobHistory]:
-        """Get job history entries."""
+    async def get_history(self, job_id: str) -> builtins.list[Row[*tuple[Any, ...]]]:
+        """Get job history entries with the name of the user who made each change."""
         stmt = (
-            select(JobHistory)
-            .options(selectinload(JobHistory.changed_by))
+            select(
+                JobHistory.id,
+                JobHistory.from_status,
+                JobHistory.to_status,
+                JobHistory.changed_at,
+                JobHistory.notes,
+                User.full_name.label("changed_by_name"),
+            )
+            .outerjoin(User, JobHistory.changed_by_id == User.id)
             .where(JobHistory.job_id == job_id)
             .order_by(JobHistory.changed_at.desc())
         )
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.all())
 
     async def delete(self, job_id: str) -> bool:
         """Soft delete a job."""
@@ -278,6 +453,8 @@ class JobRepository:
 
         job.deleted_at = datetime.now(UTC)
         await self.db.flush()
+        mark_job_changed(self.db, job_id)
+        stats_cache.clear()
         return True
 
 
@@ -287,9 +464,8 @@ class EvidenceRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_for_job_stage(self, job_id: str, stage: JobStatus) -> list:
+    async def get_for_job_stage(self, job_id: str, stage: JobStatus) -> list[Evidence]:
         """Get evidence for a specific job stage."""
-        from veriqko.evidence.models import Evidence
 
         stmt = select(Evidence).where(
             Evidence.job_id == job_id,
@@ -299,6 +475,21 @@ class EvidenceRepository:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def supersede(self, old_ids: list[str], new_id: str) -> int:
+        """Mark evidence as replaced by a newer item; returns rows changed.
+
+        A single UPDATE; the rows are never loaded. Already superseded items
+        keep their original replacement.
+        """
+        stmt = (
+            update(Evidence)
+            .where(Evidence.id.in_(old_ids), Evidence.superseded_at.is_(None))
+            .values(superseded_at=func.now(), superseded_by_id=new_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = cast("CursorResult[Any]", await self.db.execute(stmt))
+        return result.rowcount
+
 
 class JobService:
     """Job service for business logic."""
@@ -310,8 +501,22 @@ class JobService:
         self.state_machine = JobStateMachine(self.repo, self.evidence_repo)
 
     async def get(self, job_id: str) -> Job | None:
-        """Get a job by ID."""
-        return await self.repo.get(job_id)
+        """Get a job by ID for read-only use.
+
+        When the per-process job cache is enabled the returned job may be
+        detached from this session and must not be modified. Job writes drop
+        the entry once they commit.
+        """
+        job = job_cache.get(job_id)
+        if job is not None:
+            return job
+
+        job = await self.repo.get(job_id)
+        if job is not None and job_cache.enabled:
+            # Detach so later work in this session can't mutate the shared copy
+            self.db.expunge(job)
+            job_cache.set(job_id, job)
+        return job
 
     async def list(
         self,
@@ -321,7 +526,9 @@ class JobService:
         limit: int = 50,
         offset: int = 0,
         current_user: User | None = None,
-    ) -> list[Job]:
+        include: set[str] | None = None,
+        after: tuple[datetime, str] | None = None,
+    ) -> builtins.list[Job]:
         """List jobs."""
 
         status_enum = JobStatus(status) if status else None
@@ -335,14 +542,38 @@ class JobService:
             search=search,
             limit=limit,
             offset=offset,
-            current_user=current_user
+            current_user=current_user,
+            include=include,
+            after=after,
+        )
+
+    async def list_summaries(
+        self,
+        status: str | None = None,
+        technician_id: str | None = None,
+        search: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        current_user: User | None = None,
+        after: tuple[datetime, str] | None = None,
+    ) -> builtins.list[Row[*tuple[Any, ...]]]:
+        """List job table rows."""
+        status_enum = JobStatus(status) if status else None
+        return await self.repo.list_summaries(
+            status=status_enum,
+            technician_id=technician_id,
+            search=search,
+            limit=limit,
+            offset=offset,
+            current_user=current_user,
+            after=after,
         )
 
     async def create(self, data: JobCreate, user_id: str) -> Job:
         """Create a new job."""
         return await self.repo.create(data, user_id)
 
-    async def create_batch(self, data: JobBatchCreate, user_id: str) -> list[Job]:
+    async def create_batch(self, data: JobBatchCreate, user_id: str) -> builtins.list[Job]:
         """Create multiple jobs."""
         return await self.repo.create_batch(data, user_id)
 
@@ -358,8 +589,13 @@ class JobService:
         notes: str | None = None,
         is_fully_tested: bool = True,
         skip_reason: str | None = None,
+        background_tasks: BackgroundTasks | None = None,
     ) -> tuple[Job | None, TransitionResult]:
-        """Transition job to a new status."""
+        """Transition job to a new status.
+
+        Picea sync and the completion email are slow external calls; when
+        ``background_tasks`` is given they run after the response is sent.
+        """
         job = await self.repo.get(job_id)
         if not job:
             return None, None
@@ -373,6 +609,7 @@ class JobService:
             user_id=user_id,
             notes=notes,
             is_fully_tested=is_fully_tested,
+            job=job,
         )
 
         if result.success:
@@ -382,55 +619,55 @@ class JobService:
                 user_id,
                 notes,
                 is_fully_tested=is_fully_tested,
-                skip_reason=skip_reason
+                skip_reason=skip_reason,
+                job=job,
             )
 
             # Auto-trigger Picea sync when moving to RESET
             if target == JobStatus.RESET:
-                from veriqko.integrations.picea.service import PiceaService
-                picea_service = PiceaService(self.db)
-                # Fire and forget/BG task ideally, but for now we wait to ensure UI updates with fresh data
-                await picea_service.sync_job_diagnostics(job_id, user_id)
-                # Re-fetch job to get updated Picea fields
-                job = await self.repo.get(job_id)
+                # The UI polls the job for the Picea fields once the sync lands
+                if background_tasks is not None:
+                    background_tasks.add_task(sync_picea_diagnostics, job_id, user_id)
+                else:
+                    # Inline callers sync on this session: a separate session
+                    # would wait on the job row this transaction has locked
+                    await PiceaService(self.db).sync_job_diagnostics(job_id, user_id)
 
             # Send completion email if job is completed
             if target == JobStatus.COMPLETED:
-                from veriqko.integrations.email import email_service
-
                 customer_email = None
                 if job.customer_reference and "@" in job.customer_reference:
                     customer_email = job.customer_reference
 
                 if customer_email:
-                    customer_name = "Valued Customer"
-                    # Fire and forget (bg task in production)
-                    await email_service.send_completion_email(
-                        recipient_email=customer_email,
-                        recipient_name=customer_name,
-                        job_id=job.id,
-                        serial_number=job.serial_number
-                    )
+                    email_kwargs = {
+                        "recipient_email": customer_email,
+                        "recipient_name": "Valued Customer",
+                        "job_id": job.id,
+                        "serial_number": job.serial_number,
+                    }
+                    if background_tasks is not None:
+                        background_tasks.add_task(
+                            email_service.send_completion_email, **email_kwargs
+                        )
+                    else:
+                        await email_service.send_completion_email(**email_kwargs)
                 else:
                     # Log that no email was sent
-                    import logging
                     logging.getLogger("veriqko").info(f"No customer email found in reference for job {job.id}, skipping completion email")
 
                 # Trigger Miradore MDM re-enrollment
-                from veriqko.integrations.miradore import miradore_client
-                import asyncio
-                
                 # Run as a background pseudo-task by attaching to the event loop un-awaited to avoid blocking response
                 # (in a real production setup this would be an APScheduler/Celery task)
                 asyncio.create_task(miradore_client.enroll_device(job.serial_number, customer_email))
 
         return job, result
 
-    async def get_history(self, job_id: str) -> list[JobHistory]:
+    async def get_history(self, job_id: str) -> builtins.list[Row[*tuple[Any, ...]]]:
         """Get job history."""
         return await self.repo.get_history(job_id)
 
-    def get_valid_transitions(self, job: Job) -> list[str]:
+    def get_valid_transitions(self, job: Job) -> builtins.list[str]:
         """Get valid transitions for a job."""
         transitions = self.state_machine.get_valid_transitions(job.status)
         return [t.value for t in transitions]
@@ -3,8 +3,9 @@
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 
-from veriqko.jobs.models import JobStatus
+from veriqko.jobs.models import Job, JobStatus
 
 
 @dataclass
@@ -87,7 +88,7 @@ class JobStateMachine:
 
     def get_valid_transitions(self, current_status: JobStatus) -> list[JobStatus]:
         """Get list of valid target states from current state."""
-        return self.TRANSITIONS.get(current_status, [])
+        return list(_valid_transitions_cached(current_status))
 
     async def transition(
         self,
@@ -98,8 +99,12 @@ class JobStateMachine:
         notes: str | None = None,
         force: bool = False,
         is_fully_tested: bool = True,
+        job: Job | None = None,
     ) -> TransitionResult:
-        """Execute a state transition."""
+        """Execute a state transition.
+
+        Pass the already-loaded ``job`` to let the guards skip re-fetching it.
+        """
         timestamp = datetime.now(UTC)
         errors = []
         warnings = []
@@ -119,7 +124,9 @@ class JobStateMachine:
 
         # Run transition-specific guards
         if not force:
-            guard_errors = await self._run_guards(job_id, current_status, target_status, user_id, is_fully_tested)
+            guard_errors = await self._run_guards(
+                job_id, current_status, target_status, user_id, is_fully_tested, job=job
+            )
             if guard_errors:
                 return TransitionResult(
                     success=False,
@@ -146,13 +153,14 @@ class JobStateMachine:
         target_status: JobStatus,
         user_id: str,
         is_fully_tested: bool = True,
+        job: Job | None = None,
     ) -> list[str]:
         """Run transition-specific validation guards."""
         errors = []
 
         # INTAKE -> RESET: Require intake condition
         if current_status == JobStatus.INTAKE and target_status == JobStatus.RESET:
-            job = await self.job_repo.get(job_id)
+            job = job or await self.job_repo.get(job_id)
             if not job.intake_condition:
                 errors.append("Intake condition assessment must be completed")
 
@@ -162,13 +170,13 @@ class JobStateMachine:
             if not evidence:
                 errors.append("Factory reset evidence (photo/video) is required")
 
-            job = await self.job_repo.get(job_id)
+            job = job or await self.job_repo.get(job_id)
             if is_fully_tested and not job.picea_erase_confirmed:
                 errors.append("Picea Data Erasure must be confirmed before proceeding to Functional Test")
 
         # QC -> COMPLETED: Require QC sign-off
         elif current_status == JobStatus.QC and target_status == JobStatus.COMPLETED:
-            job = await self.job_repo.get(job_id)
+            job = job or await self.job_repo.get(job_id)
             if not job.qc_initials or not job.qc_technician_id:
                 errors.append("QC sign-off is required before completion")
 
@@ -190,3 +198,9 @@ class JobStateMachine:
             return "completed_at"
 
         return None
+
+
+@lru_cache(maxsize=16)
+def _valid_transitions_cached(status: JobStatus) -> tuple[JobStatus, ...]:
+    """Valid target states for a status; the transition table is static."""
+    return tuple(JobStateMachine.TRANSITIONS.get(status, ()))
@@ -0,0 +1,18 @@
+"""Background tasks for jobs."""
+
+import structlog
+
+from veriqko.db.base import async_session_factory
+from veriqko.integrations.picea.service import PiceaService
+
+logger = structlog.get_logger(__name__)
+
+
+async def sync_picea_diagnostics(job_id: str, user_id: str) -> None:
+    """Pull Picea diagnostics for a job using a dedicated session."""
+    try:
+        async with async_session_factory() as db:
+            synced = await PiceaService(db).sync_job_diagnostics(job_id, user_id)
+        logger.info("Picea diagnostics sync finished", job_id=job_id, synced=synced)
+    except Exception:
+        logger.exception("Picea diagnostics sync failed", job_id=job_id)
@@ -4,13 +4,15 @@ from contextlib import asynccontextmanager
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from pydantic_core import to_json
 
 # Import all models to ensure SQLAlchemy registration
 import veriqko.models  # noqa: F401
 from veriqko.config import get_settings
+from veriqko.db.base import engine
 from veriqko.errors.exceptions import VeriqkoError
 from veriqko.logging import logging_middleware, setup_logging
 
@@ -28,6 +30,7 @@ async def lifespan(app: FastAPI):
 
     # Initialize Scheduler
     scheduler = AsyncIOScheduler()
+    from veriqko.cron.defect_heatmap import refresh_defect_heatmap
     from veriqko.cron.sla_checker import run_sla_checker
 
     # Run SLA check every 15 minutes
@@ -38,6 +41,13 @@ async def lifespan(app: FastAPI):
         replace_existing=True,
     )
 
+    scheduler.add_job(
+        refresh_defect_heatmap,
+        IntervalTrigger(minutes=settings.defect_heatmap_refresh_minutes),
+        id="defect_heatmap",
+        replace_existing=True,
+    )
+
     scheduler.start()
     app.state.scheduler = scheduler
 
@@ -45,6 +55,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     scheduler.shutdown()
+    # Close pooled connections now rather than leaving them to be dropped
+    # when the loop goes away
+    await engine.dispose()
 
 
 def create_app() -> FastAPI:
@@ -81,6 +94,8 @@ def create_app() -> FastAPI:
         allow_origins=settings.cors_origins,
         allow_credentials=True,
         allow_methods=["*"],
+        # Let browser clients read the job list paging cursor
+        expose_headers=["X-Next-Cursor"],
         allow_headers=["*"],
     )
 
@@ -130,10 +145,13 @@ def create_app() -> FastAPI:
     # Public routes (no /api/v1 prefix)
     app.include_router(public_router)
 
+    health_body = to_json({"status": "healthy", "version": "0.1.0"})
+
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy", "version": "0.1.0"}
+        # Polled constantly by load balancers; the body is serialized once
+        return Response(content=health_body, media_type="application/json")
 
     @app.get("/")
     async def root():
@@ -10,8 +10,9 @@ from veriqko.evidence.models import Evidence  # noqa: F401
 # Then models that depend on base models
 from veriqko.jobs.models import Job, JobHistory, JobStatus  # noqa: F401
 from veriqko.parts.models import Part, PartUsage  # noqa: F401
-from veriqko.printing.models import LabelTemplate  # noqa: F401
+from veriqko.printing.models import LabelTemplate, Printer  # noqa: F401
 from veriqko.reports.models import Report  # noqa: F401
+from veriqko.settings.models import SystemSetting  # noqa: F401
 from veriqko.stations.models import Station  # noqa: F401
 from veriqko.users.models import User  # noqa: F401
 
@@ -29,4 +30,6 @@ __all__ = [
     "Part",
     "PartUsage",
     "LabelTemplate",
+    "Printer",
+    "SystemSetting",
 ]
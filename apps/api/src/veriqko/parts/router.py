@@ -1,9 +1,10 @@
-from datetime import datetime
+from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from veriqko.db.base import get_db
 from veriqko.integrations.erp_mock import erp_service
@@ -50,30 +51,45 @@ async def use_part(
     if part.quantity_on_hand < usage_in.quantity:
          raise HTTPException(status_code=400, detail="Insufficient stock")
 
-    # Deduct stock
-    part.quantity_on_hand -= usage_in.quantity
+    # Deduct stock atomically; the guard catches a concurrent withdrawal that
+    # drained the stock after the check above
+    part = await db.scalar(
+        update(Part)
+        .where(Part.id == usage_in.part_id, Part.quantity_on_hand >= usage_in.quantity)
+        .values(quantity_on_hand=Part.quantity_on_hand - usage_in.quantity)
+        .returning(Part)
+        .execution_options(populate_existing=True)
+    )
+    if part is None:
+        raise HTTPException(status_code=400, detail="Insufficient stock")
 
     # Create Usage Record
-    usage = PartUsage(
-        job_id=job_id,
-        part_id=usage_in.part_id,
-        quantity=usage_in.quantity
-    )
+    usage = (
+        await db.execute(
+            insert(PartUsage)
+            .values(
+                job_id=job_id,
+                part_id=usage_in.part_id,
+                quantity=usage_in.quantity,
+            )
+            .returning(PartUsage)
+        )
+    ).scalar_one()
+    set_committed_value(usage, "part", part)
+
+    # Commit the deduction before the ERP call: the part row stays locked
+    # until then, and the ERP only hears about usage that actually happened
+    await db.commit()
 
-    # Try to sync with ERP
     try:
-        if await erp_service.sync_part_usage(part.sku, usage_in.quantity, job_id):
-            usage.synced_at = datetime.utcnow()
+        synced = await erp_service.sync_part_usage(part.sku, usage_in.quantity, job_id)
     except Exception:
         # Don't fail the request if sync fails, just log it.
         # In real app we would have a retry worker.
-        pass
-
-    db.add(usage)
-
-    await db.commit()
-    await db.refresh(usage)
-    await db.refresh(part) # To return updated state if needed, though usage returns part object
+        synced = False
+    if synced:
+        usage.synced_at = datetime.now(UTC)
+        await db.commit()
 
     return usage
 
@@ -83,6 +99,6 @@ async def get_job_parts(job_id: str, db: AsyncSession = Depends(get_db)):
         select(PartUsage)
         .where(PartUsage.job_id == job_id)
         .order_by(PartUsage.created_at)
-        .options(joinedload(PartUsage.part))
+        .options(selectinload(PartUsage.part))
     )
     return result.scalars().all()
@@ -3,7 +3,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from veriqko.db.base import get_db
@@ -13,6 +13,9 @@ from veriqko.users.models import User, UserRole
 
 router = APIRouter(prefix="/printing/printers", tags=["printing"])
 
+# Roles allowed to change printers
+_WRITE_ROLES = frozenset({UserRole.ADMIN, UserRole.SUPERVISOR})
+
 # --- Schemas ---
 class PrinterBase(BaseModel):
     name: str
@@ -43,7 +46,21 @@ async def list_printers(
     """List all configured printers."""
     query = select(Printer).order_by(Printer.name)
     result = await db.execute(query)
-    return result.scalars().all()
+    # Only the id needs converting, so skip validation
+    return [
+        PrinterResponse.model_construct(
+            id=UUID(p.id),
+            name=p.name,
+            ip_address=p.ip_address,
+            port=p.port,
+            protocol=p.protocol,
+            is_active=p.is_active,
+            station_id=p.station_id,
+            created_at=p.created_at,
+            updated_at=p.updated_at,
+        )
+        for p in result.scalars()
+    ]
 
 @router.post("", response_model=PrinterResponse, status_code=status.HTTP_201_CREATED)
 async def create_printer(
@@ -52,7 +69,7 @@ async def create_printer(
     current_user: User = Depends(get_current_active_user),
 ):
     """Add a new printer (Admin/Supervisor only)."""
-    if current_user.role not in [UserRole.ADMIN, UserRole.SUPERVISOR]:
+    if current_user.role not in _WRITE_ROLES:
         raise HTTPException(status_code=403, detail="Not authorized")
 
     printer = Printer(**data.model_dump())
@@ -81,18 +98,20 @@ async def update_printer(
     current_user: User = Depends(get_current_active_user),
 ):
     """Update a printer (Admin/Supervisor only)."""
-    if current_user.role not in [UserRole.ADMIN, UserRole.SUPERVISOR]:
+    if current_user.role not in _WRITE_ROLES:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    printer = await db.get(Printer, printer_id)
+    result = await db.execute(
+        update(Printer)
+        .where(Printer.id == str(printer_id))
+        .values(**data.model_dump())
+        .returning(Printer)
+    )
+    printer = result.scalar_one_or_none()
     if not printer:
         raise HTTPException(status_code=404, detail="Printer not found")
 
-    for field, value in data.model_dump().items():
-        setattr(printer, field, value)
-
     await db.commit()
-    await db.refresh(printer)
     return printer
 
 @router.delete("/{printer_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -102,7 +121,7 @@ async def delete_printer(
     current_user: User = Depends(get_current_active_user),
 ):
     """Delete a printer (Admin only)."""
-    if current_user.role not in [UserRole.ADMIN]:
+    if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Not authorized")
 
     printer = await db.get(Printer, printer_id)
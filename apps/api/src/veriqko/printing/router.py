@@ -1,10 +1,11 @@
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from veriqko.db.base import get_db
 from veriqko.dependencies import get_current_active_user
@@ -13,6 +14,9 @@ from veriqko.users.models import User, UserRole
 
 router = APIRouter(prefix="/printing", tags=["printing"])
 
+# Roles allowed to change label templates
+_WRITE_ROLES = frozenset({UserRole.ADMIN, UserRole.SUPERVISOR})
+
 # --- Schemas ---
 class LabelTemplateCreate(BaseModel):
     name: str
@@ -25,7 +29,8 @@ class LabelTemplateResponse(BaseModel):
     id: UUID
     name: str
     description: str | None
-    zpl_code: str
+    # None when listed with include_zpl=false
+    zpl_code: str | None
     dimensions: str | None
     is_default: bool
     created_at: datetime
@@ -40,11 +45,37 @@ class LabelTemplateResponse(BaseModel):
 async def list_templates(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
+    include_zpl: bool = Query(True, description="Set false to omit the ZPL bodies"),
 ):
     """List all label templates."""
     query = select(LabelTemplate).order_by(LabelTemplate.name)
+    if not include_zpl:
+        query = query.options(
+            load_only(
+                LabelTemplate.id,
+                LabelTemplate.name,
+                LabelTemplate.description,
+                LabelTemplate.dimensions,
+                LabelTemplate.is_default,
+                LabelTemplate.created_at,
+                LabelTemplate.updated_at,
+            )
+        )
     result = await db.execute(query)
-    return result.scalars().all()
+    # Copied unvalidated; zpl_code is only filled in when asked for
+    return [
+        LabelTemplateResponse.model_construct(
+            id=UUID(t.id),
+            name=t.name,
+            description=t.description,
+            zpl_code=t.zpl_code if include_zpl else None,
+            dimensions=t.dimensions,
+            is_default=t.is_default,
+            created_at=t.created_at,
+            updated_at=t.updated_at,
+        )
+        for t in result.scalars()
+    ]
 
 @router.post("/templates", response_model=LabelTemplateResponse)
 async def create_template(
@@ -53,7 +84,7 @@ async def create_template(
     current_user: User = Depends(get_current_active_user),
 ):
     """Create a new label template (Admin only)."""
-    if current_user.role not in [UserRole.ADMIN, UserRole.SUPERVISOR]:
+    if current_user.role not in _WRITE_ROLES:
         raise HTTPException(status_code=403, detail="Not authorized")
 
     db_template = LabelTemplate(**template.model_dump())
@@ -82,25 +113,34 @@ async def update_template(
     current_user: User = Depends(get_current_active_user),
 ):
     """Update a label template (Admin only)."""
-    if current_user.role not in [UserRole.ADMIN, UserRole.SUPERVISOR]:
+    if current_user.role not in _WRITE_ROLES:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    template = await db.get(LabelTemplate, template_id)
-    if not template:
-        raise HTTPException(status_code=404, detail="Template not found")
-
-    # If setting as default, unset others first
+    stmt = (
+        update(LabelTemplate)
+        .where(LabelTemplate.id == str(template_id))
+        .values(**data.model_dump())
+        .returning(LabelTemplate)
+    )
+    # If setting as default, unset the current default in the same statement;
+    # a 404 below rolls this back
     if data.is_default:
-        from sqlalchemy import update
-        await db.execute(
-            update(LabelTemplate).where(LabelTemplate.id != template_id).values(is_default=False)
+        stmt = stmt.add_cte(
+            update(LabelTemplate)
+            .where(
+                LabelTemplate.id != str(template_id),
+                LabelTemplate.is_default.is_(True),
+            )
+            .values(is_default=False)
+            .cte("reset_default")
         )
 
-    for field, value in data.model_dump().items():
-        setattr(template, field, value)
+    result = await db.execute(stmt)
+    template = result.scalar_one_or_none()
+    if not template:
+        raise HTTPException(status_code=404, detail="Template not found")
 
     await db.commit()
-    await db.refresh(template)
     return template
 
 @router.delete("/templates/{template_id}", status_code=204)
@@ -110,7 +150,7 @@ async def delete_template(
     current_user: User = Depends(get_current_active_user),
 ):
     """Delete a label template (Admin only)."""
-    if current_user.role not in [UserRole.ADMIN]:
+    if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Not authorized")
 
     template = await db.get(LabelTemplate, template_id)
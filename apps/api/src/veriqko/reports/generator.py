@@ -1,10 +1,14 @@
 """PDF report generator using ReportLab."""
 
 import asyncio
+import os
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from typing import BinaryIO
 
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER
@@ -83,13 +87,17 @@ class BrandingConfig:
     footer_text: str | None
 
 
+# Shared by every generator; rendering is CPU-bound, so running more reports
+# at once than there are cores only adds contention
+_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="pdf-render")
+
+
 class PDFReportGenerator:
     """Generates Certification Reports using ReportLab."""
 
     def __init__(self, branding: BrandingConfig):
         self.branding = branding
         self.styles = self._setup_styles()
-        self._executor = ThreadPoolExecutor(max_workers=4)
 
     def _setup_styles(self) -> dict:
         """Configure custom styles."""
@@ -129,20 +137,35 @@ class PDFReportGenerator:
 
     async def generate(self, data: ReportData, output_path: Path) -> Path:
         """Generate PDF asynchronously."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            self._executor,
+            _executor,
             self._generate_sync,
             data,
             output_path,
         )
 
+    async def render(self, data: ReportData) -> bytes:
+        """Generate PDF asynchronously and return it in memory."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, self._render_sync, data)
+
     def _generate_sync(self, data: ReportData, output_path: Path) -> Path:
         """Synchronous PDF generation."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._build(data, str(output_path))
+        return output_path
+
+    def _render_sync(self, data: ReportData) -> bytes:
+        """Synchronous in-memory PDF generation."""
+        buffer = BytesIO()
+        self._build(data, buffer)
+        return buffer.getvalue()
 
+    def _build(self, data: ReportData, target: str | BinaryIO) -> None:
+        """Lay out the report and write it to a path or file object."""
         doc = SimpleDocTemplate(
-            str(output_path),
+            target,
             pagesize=letter,
             rightMargin=0.75 * inch,
             leftMargin=0.75 * inch,
@@ -172,7 +195,6 @@ class PDFReportGenerator:
         story.extend(self._build_footer())
 
         doc.build(story)
-        return output_path
 
     def _build_header(self, data: ReportData) -> list:
         """Build report header."""
@@ -378,7 +400,7 @@ class PDFReportGenerator:
 
         # Generation timestamp
         elements.append(Spacer(1, 0.25 * inch))
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
+        timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M UTC")
         elements.append(
             Paragraph(
                 f"Generated: {timestamp} | Powered by {self.branding.brand_name}",
@@ -389,8 +411,9 @@ class PDFReportGenerator:
         return elements
 
 
+@lru_cache(maxsize=1)
 def get_report_generator() -> PDFReportGenerator:
-    """Get report generator instance."""
+    """Get the report generator instance (styles are built once)."""
     from veriqko.config import get_settings
 
     settings = get_settings()
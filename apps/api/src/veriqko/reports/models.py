@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import ENUM, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,6 +33,9 @@ class Report(Base, UUIDMixin):
     """Report model - generated PDF reports with public access."""
 
     __tablename__ = "reports"
+    __table_args__ = (
+        Index("ix_reports_job_scope_variant", "job_id", "scope", "variant"),
+    )
 
     job_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -1,41 +1,57 @@
 """Reports router."""
 
+import asyncio
+import os
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Annotated
 from uuid import uuid4
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from fastapi.responses import FileResponse
-from sqlalchemy import select
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import FileResponse, RedirectResponse
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from veriqko.config import get_settings
 from veriqko.db.base import get_db
 from veriqko.dependencies import get_current_user
 from veriqko.devices.models import Device
+from veriqko.enums import UserRole
+from veriqko.evidence.storage import get_storage
 from veriqko.jobs.models import Job, TestResult
 from veriqko.reports.generator import ReportData, TestResultData, get_report_generator
 from veriqko.reports.models import Report, ReportScope, ReportVariant
 from veriqko.reports.qr import generate_access_token
 from veriqko.reports.schemas import ReportCreate, ReportListResponse, ReportResponse
+from veriqko.reports.tasks import generate_and_save_report
 from veriqko.users.models import User
 
 router = APIRouter(prefix="/jobs/{job_id}/reports", tags=["reports"])
 
+# Settings are fixed for the life of the process
+_settings = get_settings()
+
 
 @router.get("", response_model=list[ReportListResponse])
 async def list_reports(
     job_id: str,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
 ):
-    """List all reports for a job."""
-    settings = get_settings()
-
+    """List reports for a job, newest first."""
     # Security check for customers
-    from veriqko.enums import UserRole
     if current_user.role == UserRole.CUSTOMER:
         job_stmt = select(Job).where(Job.id == job_id)
         job_res = await db.execute(job_stmt)
@@ -44,23 +60,33 @@ async def list_reports(
             raise HTTPException(status_code=403, detail="Unauthorised Access")
 
     stmt = (
-        select(Report)
+        select(
+            Report.id,
+            Report.scope,
+            Report.variant,
+            Report.expires_at,
+            Report.generated_at,
+            Report.access_token,
+        )
         .where(Report.job_id == job_id)
         .order_by(Report.generated_at.desc())
+        .limit(limit)
+        .offset(offset)
     )
     result = await db.execute(stmt)
-    reports = result.scalars().all()
 
+    url_prefix = f"{_settings.base_url}/r/"
+    # Enums are unwrapped by hand, so the schema's validation can be skipped
     return [
-        ReportListResponse(
+        ReportListResponse.model_construct(
             id=r.id,
             scope=r.scope.value,
             variant=r.variant.value,
             expires_at=r.expires_at,
             generated_at=r.generated_at,
-            public_url=f"{settings.base_url}/r/{r.access_token}",
+            public_url=url_prefix + r.access_token,
         )
-        for r in reports
+        for r in result
     ]
 
 
@@ -73,48 +99,58 @@ async def create_report(
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     """Generate a new report for a job."""
-    settings = get_settings()
+    # Validate scope and variant
+    try:
+        scope = ReportScope(data.scope)
+        variant = ReportVariant(data.variant)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid scope or variant",
+        )
 
-    # Get job with relationships
+    # Get job with relationships, plus the number of reports already issued
+    # for this scope/variant, in one round trip
+    existing_versions = (
+        select(func.count())
+        .where(
+            Report.job_id == Job.id,
+            Report.scope == scope,
+            Report.variant == variant,
+        )
+        .scalar_subquery()
+    )
     stmt = (
-        select(Job)
+        select(Job, existing_versions)
         .options(
-            selectinload(Job.device).selectinload(Device.brand),
-            selectinload(Job.device).selectinload(Device.gadget_type),
-            selectinload(Job.assigned_technician),
-            selectinload(Job.qc_technician),
-            selectinload(Job.test_results).selectinload(TestResult.test_step),
+            # To-one relationships ride along in the job row; only the
+            # test results collection needs its own query
+            joinedload(Job.device).joinedload(Device.brand),
+            joinedload(Job.device).joinedload(Device.gadget_type),
+            joinedload(Job.assigned_technician),
+            joinedload(Job.qc_technician),
+            selectinload(Job.test_results).joinedload(TestResult.test_step),
         )
         .where(Job.id == job_id, Job.deleted_at.is_(None))
     )
     result = await db.execute(stmt)
-    job = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not job:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found",
         )
+    job, version_count = row
 
     # Security check for customers
-    from veriqko.enums import UserRole
     if current_user.role == UserRole.CUSTOMER:
         if job.customer_reference != current_user.email:
             raise HTTPException(status_code=403, detail="Unauthorised Access")
 
-    # Validate scope and variant
-    try:
-        scope = ReportScope(data.scope)
-        variant = ReportVariant(data.variant)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid scope or variant",
-        )
-
     # Generate access token
     access_token = generate_access_token()
-    public_url = f"{settings.base_url}/r/{access_token}"
+    public_url = f"{_settings.base_url}/r/{access_token}"
 
     # Prepare report data
     test_results = []
@@ -160,15 +196,9 @@ async def create_report(
         picea_mdm_locked=job.picea_mdm_locked,
     )
 
-    # Get version
-    version_stmt = select(Report).where(
-        Report.job_id == job_id,
-        Report.scope == scope,
-        Report.variant == variant,
-    )
-    version_result = await db.execute(version_stmt)
-    existing_reports = version_result.scalars().all()
-    version = len(existing_reports) + 1
+    version = version_count + 1
+    now = datetime.now(UTC)
+    expires_at = now + timedelta(days=_settings.report_expiry_days)
 
     report_id = str(uuid4())
 
@@ -189,7 +219,6 @@ async def create_report(
     await db.flush()
 
     # Enqueue background task
-    from veriqko.reports.tasks import generate_and_save_report
     background_tasks.add_task(
         generate_and_save_report,
         report_id=report_id,
@@ -220,11 +249,10 @@ public_router = APIRouter(tags=["public"])
 @public_router.get("/r/{token}")
 async def get_public_report(
     token: str,
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Access a report via public token."""
-    settings = get_settings()
-
     stmt = (
         select(Report)
         .options(selectinload(Report.job).selectinload(Job.device))
@@ -240,16 +268,52 @@ async def get_public_report(
         )
 
     # Check expiration
-    if report.expires_at < datetime.now(UTC):
+    now = datetime.now(UTC)
+    if report.expires_at < now:
         raise HTTPException(
             status_code=status.HTTP_410_GONE,
             detail="Report has expired",
         )
 
+    # Generation runs in the background, so the file may not exist yet
+    if not report.file_path:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report file not found",
+        )
+
+    # A token always points at the same PDF, so clients may keep it until
+    # the link expires and revalidate against the token
+    etag = f'"{report.access_token}"'
+    max_age = int((report.expires_at - now).total_seconds())
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}, immutable",
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    filename = f"report_{report.job.serial_number}_{report.scope.value}.pdf"
+
+    # Let object storage serve the bytes when it can hand out a signed URL
+    storage = get_storage()
+    url = await storage.presigned_url(
+        report.file_path,
+        expires_in=_settings.report_download_url_ttl_seconds,
+        download_name=filename,
+    )
+    if url:
+        return RedirectResponse(url, status_code=status.HTTP_302_FOUND)
+
     # Return PDF file
-    file_path = settings.storage_base_path / report.file_path
+    file_path = await storage.get_path(report.file_path)
 
-    if not file_path.exists():
+    # Stat once off the event loop and hand the result to FileResponse so it
+    # does not stat the file again
+    try:
+        stat_result = await asyncio.to_thread(os.stat, file_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Report file not found",
@@ -257,6 +321,8 @@ async def get_public_report(
 
     return FileResponse(
         path=file_path,
-        filename=f"report_{report.job.serial_number}_{report.scope.value}.pdf",
+        filename=filename,
         media_type="application/pdf",
+        headers=cache_headers,
+        stat_result=stat_result,
     )
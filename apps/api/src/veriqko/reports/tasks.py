@@ -1,7 +1,6 @@
 """Background tasks for reports."""
 
-import tempfile
-from pathlib import Path
+from io import BytesIO
 
 import structlog
 from sqlalchemy import select
@@ -11,7 +10,6 @@ from veriqko.evidence.storage import get_storage
 from veriqko.reports.generator import ReportData, get_report_generator
 from veriqko.reports.models import Report
 
-
 logger = structlog.get_logger(__name__)
 
 
@@ -26,25 +24,22 @@ async def generate_and_save_report(
     logger.info("Starting background PDF generation", report_id=report_id)
     generator = get_report_generator()
 
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-
     try:
-        # Generate the PDF file (runs in ThreadPoolExecutor internally)
-        await generator.generate(report_data, tmp_path)
-        logger.debug("PDF generated locally", tmp_path=str(tmp_path))
+        # Render in memory on the shared PDF executor and hand the bytes
+        # straight to storage
+        pdf = await generator.render(report_data)
+        logger.debug("PDF generated", size_bytes=len(pdf))
 
         # Save to storage
         storage = get_storage()
-        with open(tmp_path, "rb") as f:
-            stored = await storage.save(
-                file=f,
-                job_id=job_id,
-                filename=f"report_{serial_number}_{scope_value}.pdf",
-                mime_type="application/pdf",
-                folder="reports",
-            )
-            logger.debug("PDF uploaded to storage", file_path=stored.relative_path)
+        stored = await storage.save(
+            file=BytesIO(pdf),
+            job_id=job_id,
+            filename=f"report_{serial_number}_{scope_value}.pdf",
+            mime_type="application/pdf",
+            folder="reports",
+        )
+        logger.debug("PDF uploaded to storage", file_path=stored.relative_path)
 
         # Update the database record with file info
         async with async_session_factory() as db:
@@ -61,6 +56,3 @@ async def generate_and_save_report(
 
     except Exception:
         logger.exception("Failed to generate PDF report", report_id=report_id)
-    finally:
-        if tmp_path.exists():
-            tmp_path.unlink()
@@ -2,9 +2,12 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from veriqko.cache import TTLCache
+from veriqko.config import get_settings
 from veriqko.db.base import get_db
 from veriqko.dependencies import get_current_active_user
 from veriqko.settings.models import SystemSetting
@@ -23,6 +26,11 @@ class SettingResponse(BaseModel):
 class SettingUpdate(BaseModel):
     value: Any
 
+# Settings change rarely, so each worker keeps the listed rows for a short TTL
+_settings_cache: TTLCache[str, list[SettingResponse]] = TTLCache(
+    get_settings().settings_cache_ttl_seconds, max_entries=1
+)
+
 @router.get("", response_model=list[SettingResponse])
 async def list_settings(
     db: AsyncSession = Depends(get_db),
@@ -32,9 +40,19 @@ async def list_settings(
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    query = select(SystemSetting)
+    cached = _settings_cache.get("all")
+    if cached is not None:
+        return cached
+
+    query = select(SystemSetting.key, SystemSetting.value, SystemSetting.description)
     result = await db.execute(query)
-    return result.scalars().all()
+    # Built unvalidated from the three selected columns, once per cache fill
+    return _settings_cache.set("all", [
+        SettingResponse.model_construct(
+            key=s.key, value=s.value, description=s.description
+        )
+        for s in result
+    ])
 
 @router.get("/{key}", response_model=SettingResponse)
 async def get_setting(
@@ -64,16 +82,16 @@ async def update_setting(
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    query = select(SystemSetting).where(SystemSetting.key == key)
-    result = await db.execute(query)
-    setting = result.scalar_one_or_none()
-
-    if setting:
-        setting.value = data.value
-    else:
-        setting = SystemSetting(key=key, value=data.value)
-        db.add(setting)
+    # Single atomic upsert; two admins writing the same new key cannot both
+    # take the INSERT path
+    insert_stmt = pg_insert(SystemSetting).values(key=key, value=data.value)
+    stmt = insert_stmt.on_conflict_do_update(
+        index_elements=[SystemSetting.key],
+        set_={"value": insert_stmt.excluded.value, "updated_at": func.now()},
+    ).returning(SystemSetting)
+    result = await db.execute(stmt)
+    setting = result.scalar_one()
 
     await db.commit()
-    await db.refresh(setting)
+    _settings_cache.clear()
     return setting
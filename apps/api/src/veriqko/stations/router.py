@@ -1,9 +1,10 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 # Placeholder schemas (defining inline simple ones if no schemas.py)
 from pydantic import BaseModel, ConfigDict
+from pydantic_core import to_json
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -30,6 +31,8 @@ class StationResponse(StationBase):
 
 router = APIRouter(prefix="/stations", tags=["stations"])
 
+_CLOSED_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED)
+
 @router.get("", response_model=list[StationResponse])
 async def list_stations(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -38,7 +41,17 @@ async def list_stations(
     """List all stations."""
     stmt = select(Station)
     result = await db.execute(stmt)
-    return result.scalars().all()
+    # Station columns already have the response's types; build it unvalidated
+    return [
+        StationResponse.model_construct(
+            id=s.id,
+            name=s.name,
+            station_type=s.station_type,
+            is_active=s.is_active,
+            capabilities=s.capabilities,
+        )
+        for s in result.scalars()
+    ]
 
 @router.post("", response_model=StationResponse, status_code=status.HTTP_201_CREATED)
 async def create_station(
@@ -72,12 +85,17 @@ async def get_station_queue(
     if not station:
         raise HTTPException(status_code=404, detail="Station not found")
 
-    stmt = select(Job).where(
+    stmt = select(Job.__table__).where(
         and_(
             Job.current_station_id == station_id,
-            Job.status.notin_([JobStatus.COMPLETED, JobStatus.FAILED])
+            Job.status.notin_(_CLOSED_STATUSES)
         )
     ).order_by(Job.updated_at)
 
+    # No response model here, so serialize the column rows straight to JSON
+    # bytes rather than walking ORM objects through jsonable_encoder.
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return Response(
+        content=to_json([dict(row) for row in result.mappings()]),
+        media_type="application/json",
+    )
@@ -0,0 +1,13 @@
+"""Per-process cache for stats responses."""
+
+from collections.abc import Hashable
+from typing import Any
+
+from veriqko.cache import TTLCache
+from veriqko.config import get_settings
+
+# Computed stats payloads keyed by endpoint and arguments. Job writes in this
+# process clear it; other processes see the change once their entries expire.
+stats_cache: TTLCache[Hashable, Any] = TTLCache(
+    get_settings().stats_cache_ttl_seconds, max_entries=256
+)
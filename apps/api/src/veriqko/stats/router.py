@@ -1,23 +1,175 @@
-from datetime import UTC, datetime, timedelta
-from typing import Any
-
-from fastapi import APIRouter, Depends
-from sqlalchemy import and_, case, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+import asyncio
+from datetime import timedelta
+from typing import Any, TypeVarTuple
 
+from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
-import asyncio
-import json
+from pydantic_core import to_json
+from sqlalchemy import (
+    JSON,
+    ColumnElement,
+    Label,
+    Select,
+    String,
+    and_,
+    case,
+    cast,
+    column,
+    func,
+    literal,
+    literal_column,
+    select,
+    table,
+    true,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from veriqko.db.base import get_db, async_session_factory
+from veriqko.db.base import async_session_factory, get_db
 from veriqko.dependencies import get_current_user
-from veriqko.devices.models import Device
-from veriqko.jobs.models import Job, JobStatus, TestResult, TestResultStatus, TestStep
+from veriqko.devices.models import Brand, Device, GadgetType
+from veriqko.jobs.models import Job, JobStatus
+from veriqko.stations.models import Station
+from veriqko.stats.cache import stats_cache
 from veriqko.users.models import User
 
 router = APIRouter(prefix="/stats", tags=["stats"])
 
+_Ts = TypeVarTuple("_Ts")
+
+_IN_PROGRESS_STATUSES = (JobStatus.INTAKE, JobStatus.RESET, JobStatus.FUNCTIONAL, JobStatus.QC)
+_CLOSED_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED)
+
+_is_open_job = and_(Job.status.notin_(_CLOSED_STATUSES), Job.deleted_at.is_(None))
+
+# Overdue is critical, due within 4h is a warning
+_sla_status = case(
+    (Job.sla_due_at.is_(None), "none"),
+    (Job.sla_due_at < func.now(), "critical"),
+    (Job.sla_due_at < func.now() + timedelta(hours=4), "warning"),
+    else_="healthy",
+).label("sla_status")
+
+def _days_ago(days: int) -> ColumnElement[Any]:
+    """Cutoff evaluated by Postgres, so the statement only varies by ``days``."""
+    return func.now() - func.make_interval(0, 0, 0, days)
+
+
+# Materialized view created in migration 022
+_defect_heatmap = table(
+    "mv_defect_heatmap",
+    column("model"),
+    column("test_step"),
+    column("failure_count"),
+)
+
+
+def _floor_jobs_json() -> Label[Any]:
+    """json_agg of the active jobs joined onto the current row, '[]' when none."""
+    job_json = func.json_build_object(
+        "id", Job.id,
+        "serial_number", Job.serial_number,
+        "status", Job.status,
+        "brand", func.coalesce(Brand.name, "Unknown"),
+        "device_type", func.coalesce(GadgetType.name, "Unknown"),
+        "model", case((Device.id.is_(None), "Unknown"), else_=Device.model),
+        "updated_at", Job.updated_at,
+        "batches", Job.batch_id,
+        "picea_verify_status", Job.picea_verify_status,
+        "picea_erase_confirmed", Job.picea_erase_confirmed,
+        "picea_mdm_locked", Job.picea_mdm_locked,
+    )
+    return func.coalesce(
+        func.json_agg(job_json).filter(Job.id.is_not(None)),
+        literal_column("'[]'::json"),
+        type_=JSON,
+    ).label("jobs")
+
+
+def _join_job_device(query: Select[*_Ts]) -> Select[*_Ts]:
+    return (
+        query.outerjoin(Device, Device.id == Job.device_id)
+        .outerjoin(Brand, Brand.id == Device.brand_id)
+        .outerjoin(GadgetType, GadgetType.id == Device.type_id)
+    )
+
+
+# The dashboard and floor queries take no parameters, so they are built once
+# at import rather than on every request
+
+# Dashboard buckets counted in one pass (served by the partial status index)
+_job_counts = (
+    select(
+        func.count().label("total"),
+        func.count().filter(Job.status == JobStatus.COMPLETED).label("completed"),
+        func.count().filter(Job.status == JobStatus.FAILED).label("failed"),
+        func.count().filter(Job.status.in_(_IN_PROGRESS_STATUSES)).label("in_progress"),
+    )
+    .where(Job.deleted_at.is_(None))
+    .subquery("counts")
+)
+
+# Recent jobs as plain columns; no ORM objects are built
+_recent_jobs = (
+    _join_job_device(
+        select(
+            Job.id,
+            Job.serial_number,
+            Job.status,
+            Brand.name.label("brand"),
+            GadgetType.name.label("device_type"),
+            Device.model,
+            Job.updated_at,
+            _sla_status,
+            Job.picea_verify_status,
+            Job.picea_erase_confirmed,
+            Job.picea_mdm_locked,
+            Job.created_at,
+        ).select_from(Job)
+    )
+    .where(Job.deleted_at.is_(None))
+    .order_by(Job.created_at.desc())
+    .limit(5)
+    .subquery("recent")
+)
+
+# The single counts row is joined onto each recent job so both come back in
+# one round trip; with no jobs there is still one row, with NULL job columns
+_dashboard_query = (
+    select(_job_counts, _recent_jobs)
+    .select_from(_job_counts.outerjoin(_recent_jobs, true()))
+    .order_by(_recent_jobs.c.created_at.desc())
+)
+
+# Open jobs are grouped into per-station JSON arrays by Postgres, so a single
+# round trip returns the whole floor: the unassigned bucket, then each active
+# station by name
+_floor_query = union_all(
+    _join_job_device(
+        select(
+            literal("unassigned").label("id"),
+            literal("Unassigned / Intake Queue").label("name"),
+            literal("queue").label("type"),
+            _floor_jobs_json(),
+            literal(0).label("bucket"),
+        ).select_from(Job)
+    ).where(Job.current_station_id.is_(None), _is_open_job),
+    _join_job_device(
+        select(
+            cast(Station.id, String).label("id"),
+            Station.name,
+            cast(Station.station_type, String).label("type"),
+            _floor_jobs_json(),
+            literal(1).label("bucket"),
+        )
+        .select_from(Station)
+        .outerjoin(Job, and_(Job.current_station_id == Station.id, _is_open_job))
+    )
+    .where(Station.is_active.is_(True))
+    .group_by(Station.id),
+).order_by(literal_column("bucket"), literal_column("name"))
+
+
 @router.get("/dashboard")
 async def get_dashboard_stats(
     session: AsyncSession = Depends(get_db),
@@ -26,92 +178,49 @@ async def get_dashboard_stats(
     """
     Get aggregated statistics for the dashboard.
     """
+    cached: dict[str, Any] | None = stats_cache.get(("dashboard",))
+    if cached is not None:
+        return cached
 
-    # Base query for counts
-    # We'll do a single aggregation query for efficiency
-    query = select(
-        func.count(Job.id).label("total"),
-        func.sum(case((Job.status == JobStatus.COMPLETED, 1), else_=0)).label("completed"),
-        func.sum(case((Job.status == JobStatus.FAILED, 1), else_=0)).label("failed"),
-        func.sum(case((Job.status.in_([
-            JobStatus.INTAKE,
-            JobStatus.RESET,
-            JobStatus.FUNCTIONAL,
-            JobStatus.QC
-        ]), 1), else_=0)).label("in_progress")
-    ).where(Job.deleted_at.is_(None))
-
-    result = await session.execute(query)
-    stats = result.one()
+    result = await session.execute(_dashboard_query)
+    rows = result.all()
+    counts = rows[0]
+    recent_jobs = [row for row in rows if row.id is not None]
 
     # Calculate yield (Pass rate)
-    total_closed = (stats.completed or 0) + (stats.failed or 0)
+    total_closed = counts.completed + counts.failed
     yield_rate = 0
     if total_closed > 0:
-        yield_rate = (stats.completed / total_closed) * 100
-
-    # Get recent jobs (limit 5)
-    recent_query = (
-        select(Job)
-        .options(
-            selectinload(Job.device).selectinload(Device.brand),
-            selectinload(Job.device).selectinload(Device.gadget_type)
-        )
-        .where(Job.deleted_at.is_(None))
-        .order_by(Job.created_at.desc())
-        .limit(5)
-    )
-    recent_result = await session.execute(recent_query)
-    recent_jobs = recent_result.scalars().all()
+        yield_rate = (counts.completed / total_closed) * 100
 
-    return {
+    stats: dict[str, Any] = {
         "counts": {
-            "total": stats.total or 0,
-            "completed": stats.completed or 0,
-            "failed": stats.failed or 0,
-            "in_progress": stats.in_progress or 0
+            "total": counts.total,
+            "completed": counts.completed,
+            "failed": counts.failed,
+            "in_progress": counts.in_progress
         },
         "metrics": {
             "yield_rate": round(yield_rate, 1)
         },
         "recent_activity": [
             {
-                "id": str(job.id),
-                "serial_number": job.serial_number,
-                "status": job.status,
-                "brand": job.device.brand.name if job.device and job.device.brand else "Unknown",
-                "device_type": job.device.gadget_type.name if job.device and job.device.gadget_type else "Unknown",
-                "model": job.device.model if job.device else "Unknown",
-                "updated_at": job.updated_at,
-                "sla_status": _get_sla_status(job.sla_due_at),
-                "picea_verify_status": job.picea_verify_status,
-                "picea_erase_confirmed": job.picea_erase_confirmed,
-                "picea_mdm_locked": job.picea_mdm_locked
-            } for job in recent_jobs
+                "id": row.id,
+                "serial_number": row.serial_number,
+                "status": row.status,
+                "brand": row.brand or "Unknown",
+                "device_type": row.device_type or "Unknown",
+                "model": row.model or "Unknown",
+                "updated_at": row.updated_at,
+                "sla_status": row.sla_status,
+                "picea_verify_status": row.picea_verify_status,
+                "picea_erase_confirmed": row.picea_erase_confirmed,
+                "picea_mdm_locked": row.picea_mdm_locked
+            } for row in recent_jobs
         ]
     }
-
-def _get_sla_status(due_at: datetime | None) -> str:
-    if not due_at:
-        return "none"
-
-    now = datetime.now(UTC)
-
-    # Ensure due_at is timezone-aware if it's not
-    if due_at.tzinfo is None:
-        due_at = due_at.replace(tzinfo=UTC)
-
-    diff = due_at - now
-    hours = diff.total_seconds() / 3600
-
-    if hours < 0:
-        return "critical" # Overdue
-    if hours < 4:
-        return "warning" # Less than 4h
-    return "healthy"
-
-
-from veriqko.stations.models import Station
+    stats_cache.set(("dashboard",), stats)
+    return stats
 
 
 @router.get("/floor")
@@ -122,66 +231,26 @@ async def get_floor_status(
     """
     Get live floor status: stations with their active jobs.
     """
-    return await _get_floor_status_data(session)
+    cached: list[dict[str, Any]] | None = stats_cache.get(("floor",))
+    if cached is not None:
+        return cached
+    floor = await _get_floor_status_data(session)
+    stats_cache.set(("floor",), floor)
+    return floor
 
 async def _get_floor_status_data(session: AsyncSession) -> list[dict[str, Any]]:
-    # Fetch all active stations
-    stations_query = select(Station).where(Station.is_active == True).order_by(Station.name)
-    stations_result = await session.execute(stations_query)
-    stations = stations_result.scalars().all()
-
-    # Fetch all active jobs with device details
-    jobs_query = select(Job).options(
-        selectinload(Job.device).selectinload(Device.brand),
-        selectinload(Job.device).selectinload(Device.gadget_type)
-    ).where(
-        and_(
-            Job.status.notin_([JobStatus.COMPLETED, JobStatus.FAILED]),
-            Job.deleted_at.is_(None)
-        )
-    )
-    jobs_result = await session.execute(jobs_query)
-    active_jobs = jobs_result.scalars().all()
-
-    # Group jobs by station
-    jobs_by_station = {}
-    for job in active_jobs:
-        station_id = str(job.current_station_id) if job.current_station_id else "unassigned"
-        if station_id not in jobs_by_station:
-            jobs_by_station[station_id] = []
-
-        jobs_by_station[station_id].append({
-            "id": str(job.id),
-            "serial_number": job.serial_number,
-            "status": job.status,
-            "brand": job.device.brand.name if job.device and job.device.brand else "Unknown",
-            "device_type": job.device.gadget_type.name if job.device and job.device.gadget_type else "Unknown",
-            "model": job.device.model if job.device else "Unknown",
-            "updated_at": job.updated_at,
-            "batches": job.batch_id,
-            "picea_verify_status": job.picea_verify_status,
-            "picea_erase_confirmed": job.picea_erase_confirmed,
-            "picea_mdm_locked": job.picea_mdm_locked
-        })
+    result = await session.execute(_floor_query)
 
-    # Build response structure
     floor_view = []
-
-    if "unassigned" in jobs_by_station and jobs_by_station["unassigned"]:
+    for row in result:
+        # The unassigned bucket is only shown when it has jobs
+        if row.bucket == 0 and not row.jobs:
+            continue
         floor_view.append({
-            "id": "unassigned",
-            "name": "Unassigned / Intake Queue",
-            "type": "queue",
-            "jobs": jobs_by_station["unassigned"]
-        })
-
-    for station in stations:
-        s_id = str(station.id)
-        floor_view.append({
-            "id": s_id,
-            "name": station.name,
-            "type": station.station_type,
-            "jobs": jobs_by_station.get(s_id, [])
+            "id": row.id,
+            "name": row.name,
+            "type": row.type,
+            "jobs": row.jobs,
         })
 
     return floor_view
@@ -197,7 +266,8 @@ async def get_floor_status_stream(
         while True:
             async with async_session_factory() as db_session:
                 floor_view = await _get_floor_status_data(db_session)
-                yield f"data: {json.dumps(floor_view, default=str)}\n\n"
+                # Encoded in Rust, like the JSON responses of the other endpoints
+                yield b"data: " + to_json(floor_view) + b"\n\n"
             await asyncio.sleep(5)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
@@ -212,49 +282,49 @@ async def get_defect_heatmap(
     Get defect heatmap aggregated by Device Model and Test Step.
     Returns list of { model, test_step, count }.
     """
-    # Query: Count failed TestResults grouped by Job->Device->Model and TestStep->Name
+    cached: list[dict[str, Any]] | None = stats_cache.get(("defects",))
+    if cached is not None:
+        return cached
+
+    # Failed TestResults grouped by device model and test step, precomputed
+    # in mv_defect_heatmap and refreshed by the defect heatmap cron job
     query = (
         select(
-            Device.model,
-            TestStep.name.label("test_step"),
-            func.count(TestResult.id).label("failure_count")
+            _defect_heatmap.c.model,
+            _defect_heatmap.c.test_step,
+            _defect_heatmap.c.failure_count,
         )
-        .select_from(TestResult)
-        .join(TestResult.job)
-        .join(Job.device)
-        .join(TestResult.test_step)
-        .where(
-            and_(
-                TestResult.status == TestResultStatus.FAIL,
-                Job.deleted_at.is_(None)
-            )
-        )
-        .group_by(Device.model, TestStep.name)
-        .order_by(func.count(TestResult.id).desc())
+        .order_by(_defect_heatmap.c.failure_count.desc())
         .limit(100)
     )
 
     result = await session.execute(query)
     rows = result.all()
 
-    return [
+    defects: list[dict[str, Any]] = [
         {
             "model": row.model,
             "test_step": row.test_step,
             "count": row.failure_count
         } for row in rows
     ]
+    stats_cache.set(("defects",), defects)
+    return defects
 
 @router.get("/technicians")
 async def get_technician_leaderboard(
-    days: int = 7,
+    days: int = Query(7, ge=1, le=365),
     session: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> list[dict[str, Any]]:
     """
     Get technician efficiency leaderboard for the last N days.
     """
-    cutoff = datetime.now(UTC) - timedelta(days=days)
+    cached: list[dict[str, Any]] | None = stats_cache.get(("technicians", days))
+    if cached is not None:
+        return cached
+
+    cutoff = _days_ago(days)
 
     # Query: Jobs completed per assigned technician in period
     query = (
@@ -279,23 +349,25 @@ async def get_technician_leaderboard(
     result = await session.execute(query)
     rows = result.all()
 
-    return [
+    leaderboard: list[dict[str, Any]] = [
         {
             "name": row.full_name,
             "jobs_completed": row.jobs_completed
         } for row in rows
     ]
+    stats_cache.set(("technicians", days), leaderboard)
+    return leaderboard
 
 @router.get("/throughput")
 async def get_throughput_times(
-    days: int = 30,
+    days: int = Query(30, ge=1, le=365),
     session: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> dict[str, Any]:
     """
     Get average throughput time (Genomströmningstid) per station for the last N days.
     """
-    cutoff = datetime.now(UTC) - timedelta(days=days)
+    cutoff = _days_ago(days)
 
     from sqlalchemy import extract
 
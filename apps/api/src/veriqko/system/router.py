@@ -9,15 +9,22 @@ from veriqko.users.models import User
 
 router = APIRouter(prefix="/system", tags=["System"])
 
+# Roles allowed to see version and update status
+_STATUS_ROLES = frozenset({UserRole.ADMIN, UserRole.SUPERVISOR})
+
 @router.get("/version", response_model=SystemVersion)
 async def get_system_version(
     current_user: Annotated[User, Depends(get_current_active_user)],
+    force: bool = False,
 ):
-    """Get current system version and check for updates."""
-    if current_user.role not in [UserRole.ADMIN, UserRole.SUPERVISOR]:
+    """Get current system version and check for updates.
+
+    Pass ``force=true`` to skip the cached result of the last check.
+    """
+    if current_user.role not in _STATUS_ROLES:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    return await system_service.check_for_updates()
+    return await system_service.check_for_updates(force=force)
 
 @router.post("/update")
 async def trigger_system_update(
@@ -28,7 +35,7 @@ async def trigger_system_update(
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Only admins can update the system")
 
-    system_service.trigger_update(target_version)
+    await system_service.trigger_update(target_version)
     return {"message": "Update initiated. Check status for progress."}
 
 @router.get("/status", response_model=UpdateStatus)
@@ -36,7 +43,7 @@ async def get_update_status(
     current_user: Annotated[User, Depends(get_current_active_user)],
 ):
     """Get the status of the ongoing update."""
-    if current_user.role not in [UserRole.ADMIN, UserRole.SUPERVISOR]:
+    if current_user.role not in _STATUS_ROLES:
         raise HTTPException(status_code=403, detail="Not authorized")
 
     return await system_service.get_update_status()
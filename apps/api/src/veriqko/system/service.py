@@ -1,10 +1,12 @@
 import asyncio
 import os
-import subprocess
 from datetime import datetime
 
 from pydantic import BaseModel
 
+from veriqko.cache import TTLCache
+from veriqko.config import get_settings
+
 
 class SystemVersion(BaseModel):
     current_version: str
@@ -24,68 +26,117 @@ class SystemService:
 
     UPDATE_SCRIPT_PATH = "scripts/system_update.sh"
     STATUS_FILE = "/opt/veriqko/update_status.json"
+    # A fetch from an unreachable remote can hang well past any request timeout
+    GIT_TIMEOUT_SECONDS = 30
+
+    def __init__(self) -> None:
+        settings = get_settings()
+        # Last update check
+        self._version_cache: TTLCache[str, SystemVersion] = TTLCache(
+            settings.update_check_cache_ttl_seconds, max_entries=1
+        )
+        # Checked-out version
+        self._current_version_cache: TTLCache[str, str] = TTLCache(
+            settings.current_version_cache_ttl_seconds, max_entries=1
+        )
 
-    async def get_current_version(self) -> str:
-        """Get current git hash or tag."""
+    async def _git(self, *args: str) -> tuple[int, str]:
+        """Run a git command without a shell and return its exit code and stdout.
+
+        A command that outlives ``GIT_TIMEOUT_SECONDS`` is killed and reported
+        with exit code 124, as ``timeout(1)`` does.
+        """
         try:
-            # First try git describe for tag
-            process = await asyncio.create_subprocess_shell(
-                "git describe --tags",
+            process = await asyncio.create_subprocess_exec(
+                "git",
+                *args,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                # Fail instead of waiting on a credentials prompt nobody sees
+                env=os.environ | {"GIT_TERMINAL_PROMPT": "0"},
+            )
+        except OSError:
+            # git is not installed
+            return 127, ""
+        try:
+            stdout, _ = await asyncio.wait_for(
+                process.communicate(), timeout=self.GIT_TIMEOUT_SECONDS
             )
-            stdout, _ = await process.communicate()
-            if process.returncode == 0:
-                return stdout.decode().strip()
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            return 124, ""
+        # The process has exited by now; wait() just hands back its exit code
+        return await process.wait(), stdout.decode().strip()
 
-            # Fallback to short hash
-            process = await asyncio.create_subprocess_shell(
-                "git rev-parse --short HEAD",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+    async def get_current_version(self) -> str:
+        """Get current git tag, or the short hash when HEAD is untagged."""
+        cached = self._current_version_cache.get("current")
+        if cached is not None:
+            return cached
+
+        try:
+            # Probe the tag and the hash at the same time; the tag wins
+            (describe_code, described), (_, short_hash) = await asyncio.gather(
+                self._git("describe", "--tags"),
+                self._git("rev-parse", "--short", "HEAD"),
             )
-            stdout, _ = await process.communicate()
-            return stdout.decode().strip()
+            version = (described if describe_code == 0 else "") or short_hash or "unknown"
         except Exception:
             return "unknown"
 
-    async def check_for_updates(self) -> SystemVersion:
-        """Fetch remote tags and compare with current."""
-        # Fetch latest
-        await asyncio.create_subprocess_shell("git fetch --tags")
+        return self._current_version_cache.set("current", version)
 
-        current = await self.get_current_version()
+    async def check_for_updates(self, force: bool = False) -> SystemVersion:
+        """Fetch remote tags and compare with current.
 
-        # Get latest remote tag
-        process = await asyncio.create_subprocess_shell(
-            "git describe --tags $(git rev-list --tags --max-count=1)",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+        The result is reused for a few minutes unless ``force`` is set.
+        """
+        cached = None if force else self._version_cache.get("latest")
+        if cached is not None:
+            return cached
+
+        # Fetching tags does not change the checked-out version, so look that
+        # up while the fetch runs
+        _, current = await asyncio.gather(
+            self._git("fetch", "--tags"),
+            self.get_current_version(),
         )
-        stdout, _ = await process.communicate()
-        latest = stdout.decode().strip() or current
 
-        return SystemVersion(
+        # Get latest remote tag
+        latest = ""
+        returncode, latest_rev = await self._git("rev-list", "--tags", "--max-count=1")
+        if returncode == 0 and latest_rev:
+            _, latest = await self._git("describe", "--tags", latest_rev)
+        latest = latest or current
+
+        version = SystemVersion(
             current_version=current,
             latest_version=latest,
             is_update_available=current != latest,
             last_checked=datetime.now()
         )
+        return self._version_cache.set("latest", version)
 
-    def trigger_update(self, target_version: str = "main") -> None:
+    async def trigger_update(self, target_version: str = "main") -> None:
         """
         Trigger the background update script.
-        We use subprocess.Popen with nohup to detach it completely.
+        It runs in its own session so it is detached from the API process.
         """
+        # The running version is about to change
+        self._version_cache.clear()
+        self._current_version_cache.clear()
+
         # Ensure script is executable
         os.chmod(self.UPDATE_SCRIPT_PATH, 0o755)
 
-        # Run detached
-        subprocess.Popen(
-            ["nohup", self.UPDATE_SCRIPT_PATH, target_version, "&"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            preexec_fn=os.setpgrp
+        # Run detached; no shell, so target_version is passed as one argument
+        await asyncio.create_subprocess_exec(
+            self.UPDATE_SCRIPT_PATH,
+            target_version,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+            start_new_session=True
         )
 
     async def get_update_status(self) -> UpdateStatus:
@@ -0,0 +1,14 @@
+"""Per-process cache for test step templates."""
+
+from typing import Any
+
+from veriqko.cache import TTLCache
+from veriqko.config import get_settings
+from veriqko.jobs.models import JobStatus
+
+# A device's test steps for one station, in display order, keyed by
+# (device_id, station_type). Template edits in this process clear it; other
+# processes see the change once their entries expire.
+step_template_cache: TTLCache[tuple[str, JobStatus], list[dict[str, Any]]] = TTLCache(
+    get_settings().step_template_cache_ttl_seconds
+)
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from veriqko.db.base import get_db
 from veriqko.dependencies import get_current_user
 from veriqko.jobs.models import JobStatus, TestStep
+from veriqko.templates.cache import step_template_cache
 from veriqko.templates.schemas import TestStepCreate, TestStepResponse, TestStepUpdate
 from veriqko.users.models import User
 
@@ -28,7 +29,24 @@ async def list_templates(
         stmt = stmt.where(TestStep.station_type == station_type)
 
     result = await db.execute(stmt)
-    return result.scalars().all()
+    # Step rows are used as loaded, without per-field validation
+    return [
+        TestStepResponse.model_construct(
+            id=s.id,
+            device_id=s.device_id,
+            name=s.name,
+            description=s.description,
+            station_type=s.station_type,
+            sequence_order=s.sequence_order,
+            is_mandatory=s.is_mandatory,
+            requires_evidence=s.requires_evidence,
+            evidence_instructions=s.evidence_instructions,
+            criteria=s.criteria,
+            created_at=s.created_at,
+            updated_at=s.updated_at,
+        )
+        for s in result.scalars()
+    ]
 
 @router.post("", response_model=TestStepResponse, status_code=status.HTTP_201_CREATED)
 async def create_template(
@@ -48,6 +66,7 @@ async def create_template(
     step = TestStep(**data.model_dump())
     db.add(step)
     await db.commit()
+    step_template_cache.clear()
     await db.refresh(step)
     return step
 
@@ -68,6 +87,7 @@ async def update_template(
         setattr(step, field, value)
 
     await db.commit()
+    step_template_cache.clear()
     await db.refresh(step)
     return step
 
@@ -84,3 +104,4 @@ async def delete_template(
 
     await db.delete(step)
     await db.commit()
+    step_template_cache.clear()
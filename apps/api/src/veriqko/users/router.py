@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from veriqko.auth.password import hash_password
 from veriqko.db.base import get_db
-from veriqko.dependencies import get_current_user, require_role
+from veriqko.dependencies import get_current_user, invalidate_cached_user, require_role
 from veriqko.users.models import User, UserRole
 from veriqko.users.schemas import UserCreate, UserListResponse, UserResponse, UserUpdate
 
@@ -147,7 +147,8 @@ async def update_user(
     for field, value in update_data.items():
         setattr(user, field, value)
 
-    await db.flush()
+    await db.commit()
+    invalidate_cached_user(user.id)
 
     return UserResponse(
         id=user.id,
@@ -173,7 +174,8 @@ async def forget_me(
     current_user.is_active = False
     current_user.deleted_at = datetime.now(UTC)
 
-    await db.flush()
+    await db.commit()
+    invalidate_cached_user(current_user.id)
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -200,4 +202,5 @@ async def delete_user(
         )
 
     user.deleted_at = datetime.now(UTC)
-    await db.flush()
+    await db.commit()
+    invalidate_cached_user(user.id)
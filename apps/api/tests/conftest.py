@@ -1,14 +1,17 @@
 import asyncio
 from collections.abc import AsyncGenerator, Generator
+from uuid import uuid4
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 
 from veriqko.config import get_settings
-from veriqko.db.base import get_db
+from veriqko.db.base import Base, get_db
 from veriqko.main import app
 
 settings = get_settings()
@@ -28,16 +31,46 @@ def event_loop() -> Generator:
     yield loop
     loop.close()
 
+def _create_schema(conn) -> None:
+    # The model enums are created by the migrations (create_type=False), so
+    # create_all needs them made first. Most models bind member names while
+    # the migrations and partial index predicates use the lowercase values,
+    # so each type accepts both.
+    enums = {
+        column.type.name: column.type
+        for table in Base.metadata.tables.values()
+        for column in table.columns
+        if isinstance(column.type, ENUM)
+    }
+    for name, enum in enums.items():
+        labels = dict.fromkeys([*enum.enums, *(member.value for member in enum.enum_class)])
+        ENUM(*labels, name=name).create(conn, checkfirst=False)
+    Base.metadata.create_all(conn)
+
+
 @pytest.fixture(scope="session")
 async def db_engine():
-    engine = create_async_engine(str(settings.database_url), poolclass=NullPool)
-    # async with engine.begin() as conn:
-    #     await conn.run_sync(Base.metadata.create_all)
+    # Tests run against a throwaway schema built from the models, so they
+    # don't depend on how far the target database has been migrated
+    schema = f"test_{uuid4().hex[:12]}"
+    admin_engine = create_async_engine(str(settings.database_url), poolclass=NullPool)
+    async with admin_engine.begin() as conn:
+        await conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+
+    engine = create_async_engine(
+        str(settings.database_url),
+        poolclass=NullPool,
+        connect_args={"server_settings": {"search_path": schema}},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(_create_schema)
     yield engine
-    # async with engine.begin() as conn:
-    #     await conn.run_sync(Base.metadata.drop_all)
     await engine.dispose()
 
+    async with admin_engine.begin() as conn:
+        await conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+    await admin_engine.dispose()
+
 @pytest.fixture(scope="function")
 async def db_session(db_engine) -> AsyncGenerator[AsyncSession, None]:
     async_session = sessionmaker(
@@ -67,6 +100,19 @@ async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient,
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def count_queries(db_engine) -> Generator[list[str], None, None]:
+    """Collect the SQL statements run on the test engine."""
+    queries: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield queries
+    event.remove(db_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest.fixture
 def auth_headers() -> dict:
     # Returns headers for a mocked authenticated user
@@ -0,0 +1,105 @@
+from uuid import uuid4
+
+import pyotp
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.auth.jwt import create_access_token
+from veriqko.dependencies import _user_cache
+from veriqko.users.models import User, UserRole
+
+
+def _user_queries(queries: list[str]) -> list[str]:
+    return [q for q in queries if "FROM users" in q]
+
+
+@pytest.fixture
+async def admin_headers(db_session: AsyncSession):
+    user = User(
+        id=str(uuid4()),
+        email=f"{uuid4().hex}@example.com",
+        hashed_password="x",
+        full_name="Admin",
+        role=UserRole.ADMIN,
+        is_active=True,
+        mfa_enabled=False,
+    )
+    db_session.add(user)
+    await db_session.flush()
+    _user_cache.clear()
+    token = create_access_token(user.id, user.email, user.role.value)
+    yield {"Authorization": f"Bearer {token}"}, user.id
+    _user_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_current_user_is_cached(async_client: AsyncClient, admin_headers, count_queries):
+    headers, _ = admin_headers
+
+    response = await async_client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+    assert len(_user_queries(count_queries)) == 1
+
+    count_queries.clear()
+    response = await async_client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "Admin"
+    assert _user_queries(count_queries) == []
+
+
+@pytest.mark.asyncio
+async def test_user_update_invalidates_cache(
+    async_client: AsyncClient, admin_headers, count_queries
+):
+    headers, user_id = admin_headers
+    await async_client.get("/api/v1/auth/me", headers=headers)
+
+    response = await async_client.patch(
+        f"/api/v1/users/{user_id}", json={"full_name": "Renamed"}, headers=headers
+    )
+    assert response.status_code == 200
+
+    count_queries.clear()
+    response = await async_client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "Renamed"
+    # The update dropped the cached copy, so the user is read again
+    assert len(_user_queries(count_queries)) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_user_holds_no_secrets(async_client: AsyncClient, admin_headers):
+    headers, user_id = admin_headers
+
+    response = await async_client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+
+    cached = _user_cache.get(user_id)
+    assert cached is not None
+    assert cached["role"] == UserRole.ADMIN
+    assert "hashed_password" not in cached
+    assert "mfa_secret" not in cached
+
+
+@pytest.mark.asyncio
+async def test_mfa_setup_with_cached_user(
+    async_client: AsyncClient, db_session: AsyncSession, admin_headers
+):
+    headers, user_id = admin_headers
+    await async_client.get("/api/v1/auth/me", headers=headers)
+
+    response = await async_client.post("/api/v1/auth/mfa/setup", headers=headers)
+    assert response.status_code == 200
+    secret = response.json()["secret"]
+
+    # Re-cache the user, then drop the loaded rows this shared test session
+    # holds so the next request builds its user from the cache alone
+    await async_client.get("/api/v1/auth/me", headers=headers)
+    db_session.expunge_all()
+    response = await async_client.post(
+        "/api/v1/auth/mfa/verify", json={"code": pyotp.TOTP(secret).now()}, headers=headers
+    )
+    assert response.status_code == 200
+    assert await db_session.scalar(select(User.mfa_enabled).where(User.id == user_id))
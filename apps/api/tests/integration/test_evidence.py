@@ -0,0 +1,150 @@
+from unittest.mock import patch
+from urllib.parse import quote
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.dependencies import get_current_user
+from veriqko.evidence.models import Evidence
+from veriqko.evidence.storage import get_storage
+from veriqko.jobs.models import Job, JobStatus
+from veriqko.main import app
+from veriqko.users.models import User, UserRole
+
+
+def _stored_files(job_id: str) -> list[str]:
+    """Live (not soft-deleted) files stored under a job."""
+    base_path = get_storage().base_path
+    return [
+        str(path)
+        for path in base_path.glob(f"evidence/*/*/{job_id}/*")
+        if path.is_file()
+    ]
+
+
+@pytest.fixture
+async def evidence_job(db_session: AsyncSession):
+    user = User(
+        id=str(uuid4()),
+        email=f"{uuid4().hex}@example.com",
+        hashed_password="x",
+        full_name="Evidence",
+        role=UserRole.TECHNICIAN,
+        is_active=True,
+        mfa_enabled=False,
+    )
+    job = Job(id=str(uuid4()), serial_number="SN-EVIDENCE", status=JobStatus.INTAKE)
+    db_session.add_all([user, job])
+    await db_session.flush()
+    app.dependency_overrides[get_current_user] = lambda: user
+    yield job
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.mark.asyncio
+async def test_bulk_upload_stores_every_file(
+    async_client: AsyncClient, db_session: AsyncSession, evidence_job: Job
+):
+    files = [
+        ("files", ("front.jpg", b"front", "image/jpeg")),
+        ("files", ("back.jpg", b"back", "image/jpeg")),
+    ]
+    response = await async_client.post(f"/api/v1/jobs/{evidence_job.id}/evidence/bulk", files=files)
+
+    assert response.status_code == 201
+    assert [item["original_filename"] for item in response.json()] == ["front.jpg", "back.jpg"]
+    count = await db_session.scalar(
+        select(func.count()).select_from(Evidence).where(Evidence.job_id == evidence_job.id)
+    )
+    assert count == 2
+    assert len(_stored_files(evidence_job.id)) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_upload_rejected_file_leaves_nothing_behind(
+    async_client: AsyncClient, evidence_job: Job
+):
+    files = [
+        ("files", ("front.jpg", b"front", "image/jpeg")),
+        ("files", ("payload.exe", b"MZ", "application/x-msdownload")),
+    ]
+    response = await async_client.post(f"/api/v1/jobs/{evidence_job.id}/evidence/bulk", files=files)
+
+    assert response.status_code == 400
+    assert _stored_files(evidence_job.id) == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_upload_for_malformed_job_id_is_not_found(
+    async_client: AsyncClient, evidence_job: Job
+):
+    files = [("files", ("front.jpg", b"front", "image/jpeg"))]
+
+    response = await async_client.post("/api/v1/jobs/not-a-uuid/evidence/bulk", files=files)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_bulk_upload_over_file_limit_stores_nothing(
+    async_client: AsyncClient, evidence_job: Job
+):
+    files = [
+        ("files", ("front.jpg", b"front", "image/jpeg")),
+        ("files", ("back.jpg", b"back", "image/jpeg")),
+    ]
+    with patch("veriqko.evidence.router._MAX_FILES_PER_UPLOAD", 1):
+        response = await async_client.post(
+            f"/api/v1/jobs/{evidence_job.id}/evidence/bulk", files=files
+        )
+
+    assert response.status_code == 400
+    assert _stored_files(evidence_job.id) == []
+
+
+@pytest.mark.asyncio
+async def test_upload_for_unknown_job_stores_nothing(async_client: AsyncClient, evidence_job: Job):
+    job_id = str(uuid4())
+    files = {"file": ("front.jpg", b"front", "image/jpeg")}
+
+    response = await async_client.post(f"/api/v1/jobs/{job_id}/evidence", files=files)
+    assert response.status_code == 404
+    assert _stored_files(job_id) == []
+
+    response = await async_client.post("/api/v1/jobs/not-a-uuid/evidence", files=files)
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("filename", "disposition"),
+    [
+        ("front.jpg", 'attachment; filename="front.jpg"'),
+        ("skärm 1.jpg", "attachment; filename*=utf-8''sk%C3%A4rm%201.jpg"),
+    ],
+)
+async def test_download_hands_local_file_to_nginx(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    evidence_job: Job,
+    filename: str,
+    disposition: str,
+):
+    files = {"file": (filename, b"front", "image/jpeg")}
+    response = await async_client.post(f"/api/v1/jobs/{evidence_job.id}/evidence", files=files)
+    evidence_id = response.json()["id"]
+    file_path = await db_session.scalar(
+        select(Evidence.file_path).where(Evidence.id == evidence_id)
+    )
+
+    with patch("veriqko.evidence.router._ACCEL_REDIRECT_PREFIX", "/protected"):
+        response = await async_client.get(f"/api/v1/evidence/{evidence_id}/download")
+
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["x-accel-redirect"] == quote(f"/protected/{file_path}")
+    assert response.headers["content-disposition"] == disposition
+    assert response.headers["content-type"] == "image/jpeg"
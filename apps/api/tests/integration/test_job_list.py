@@ -0,0 +1,78 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.dependencies import get_current_user
+from veriqko.jobs.models import Job, JobStatus
+from veriqko.main import app
+from veriqko.users.models import User, UserRole
+
+
+@pytest.fixture
+async def listed_jobs(db_session: AsyncSession):
+    """Five jobs sharing a serial prefix, three of them created at the same instant."""
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=str(uuid4()),
+        email="lister@example.com",
+        full_name="Lister",
+        role=UserRole.ADMIN,
+    )
+    prefix = f"PAGE-{uuid4().hex[:8]}"
+    now = datetime.now(UTC)
+    created = [now, now, now, now - timedelta(minutes=1), now - timedelta(minutes=2)]
+    jobs = [
+        Job(
+            id=str(uuid4()),
+            serial_number=f"{prefix}-{i}",
+            status=JobStatus.INTAKE,
+            created_at=created_at,
+        )
+        for i, created_at in enumerate(created)
+    ]
+    db_session.add_all(jobs)
+    await db_session.flush()
+    # Newest first, ties broken by id
+    expected = [job.id for job in sorted(jobs, key=lambda j: (j.created_at, j.id), reverse=True)]
+    yield prefix, expected
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+async def _walk(async_client: AsyncClient, prefix: str, limit: int) -> list[list[str]]:
+    pages = []
+    params = {"search": prefix, "limit": limit}
+    while True:
+        response = await async_client.get("/api/v1/jobs", params=params)
+        assert response.status_code == 200
+        pages.append([row["id"] for row in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return pages
+        params["cursor"] = cursor
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_through_ties(async_client: AsyncClient, listed_jobs):
+    prefix, expected = listed_jobs
+
+    pages = await _walk(async_client, prefix, limit=2)
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [job_id for page in pages for job_id in page] == expected
+
+
+@pytest.mark.asyncio
+async def test_full_last_page_has_no_cursor(async_client: AsyncClient, listed_jobs):
+    prefix, expected = listed_jobs
+
+    pages = await _walk(async_client, prefix, limit=5)
+
+    assert pages == [expected]
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(async_client: AsyncClient, listed_jobs):
+    response = await async_client.get("/api/v1/jobs", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
@@ -0,0 +1,148 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.devices.models import Brand, Device, GadgetType
+from veriqko.evidence.models import Evidence, EvidenceType
+from veriqko.jobs.cache import job_cache
+from veriqko.jobs.models import Job, JobStatus
+from veriqko.jobs.schemas import JobUpdate
+from veriqko.jobs.service import EvidenceRepository, JobRepository, JobService
+from veriqko.users.models import User, UserRole
+
+
+@pytest.fixture
+async def job_with_user(db_session: AsyncSession):
+    user = User(
+        id=str(uuid4()),
+        email=f"{uuid4().hex}@example.com",
+        hashed_password="x",
+        full_name="Service",
+        role=UserRole.TECHNICIAN,
+        is_active=True,
+        mfa_enabled=False,
+    )
+    job = Job(id=str(uuid4()), serial_number=f"SN-{uuid4().hex[:8]}", status=JobStatus.INTAKE)
+    db_session.add_all([user, job])
+    await db_session.flush()
+    return job, user
+
+
+def _evidence(job: Job, user: User, **kwargs) -> Evidence:
+    now = datetime.now(UTC)
+    return Evidence(
+        id=str(uuid4()),
+        job_id=job.id,
+        evidence_type=EvidenceType.PHOTO,
+        original_filename="board.jpg",
+        stored_filename="board.jpg",
+        file_path="evidence/board.jpg",
+        file_size_bytes=1,
+        mime_type="image/jpeg",
+        sha256_hash="0" * 64,
+        captured_at=now,
+        created_at=now,
+        captured_by_id=user.id,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_supersede_skips_already_superseded_evidence(
+    db_session: AsyncSession, job_with_user, count_queries
+):
+    job, user = job_with_user
+    earlier = datetime.now(UTC) - timedelta(days=1)
+    first_replacement, replacement = _evidence(job, user), _evidence(job, user)
+    live = [_evidence(job, user), _evidence(job, user)]
+    replaced = _evidence(job, user, superseded_at=earlier, superseded_by_id=first_replacement.id)
+    db_session.add_all([first_replacement, replacement, *live, replaced])
+    await db_session.flush()
+    count_queries.clear()
+
+    changed = await EvidenceRepository(db_session).supersede(
+        [item.id for item in [*live, replaced]], replacement.id
+    )
+
+    assert changed == 2
+    assert len(count_queries) == 1
+    assert count_queries[0].lstrip().upper().startswith("UPDATE")
+    rows = await db_session.execute(
+        select(Evidence.id, Evidence.superseded_by_id, Evidence.superseded_at).where(
+            Evidence.id.in_([item.id for item in [*live, replaced]])
+        )
+    )
+    by_id = {row.id: row for row in rows}
+    for item in live:
+        assert by_id[item.id].superseded_by_id == replacement.id
+        assert by_id[item.id].superseded_at is not None
+    # The earlier replacement is kept
+    assert by_id[replaced.id].superseded_by_id == first_replacement.id
+    assert by_id[replaced.id].superseded_at == earlier
+
+
+@pytest.mark.asyncio
+async def test_list_loads_only_included_relationships(
+    db_session: AsyncSession, job_with_user, count_queries
+):
+    job, user = job_with_user
+    brand = Brand(id=str(uuid4()), name=f"Brand {uuid4().hex[:8]}")
+    gadget_type = GadgetType(id=str(uuid4()), name=f"Phone {uuid4().hex[:8]}")
+    device = Device(id=str(uuid4()), brand_id=brand.id, type_id=gadget_type.id, model="Model X")
+    job.device_id = device.id
+    job.assigned_technician_id = user.id
+    db_session.add_all([brand, gadget_type, device])
+    await db_session.flush()
+    # List fresh instances rather than the ones already in the identity map
+    db_session.expunge_all()
+    repo = JobRepository(db_session)
+
+    [listed] = await repo.list(search=job.serial_number)
+    with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+        listed.device
+    db_session.expunge_all()
+
+    count_queries.clear()
+    [listed] = await repo.list(search=job.serial_number, include={"device"})
+    # The job and its device, then nothing more on access
+    assert len(count_queries) == 2
+    assert listed.device.model == "Model X"
+    assert len(count_queries) == 2
+    with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+        listed.assigned_technician
+
+
+@pytest.fixture
+def enabled_job_cache():
+    with patch.object(job_cache, "ttl_seconds", 60):
+        yield
+    job_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_job_cache_entry_is_dropped_when_the_write_commits(
+    db_session: AsyncSession, job_with_user, enabled_job_cache
+):
+    job, _ = job_with_user
+    await db_session.commit()
+    service = JobService(db_session)
+
+    await service.get(job.id)
+    assert job_cache.get(job.id) is not None
+
+    await service.update(job.id, JobUpdate(qc_notes="Rolled back"))
+    await db_session.rollback()
+    assert job_cache.get(job.id) is not None
+
+    await service.update(job.id, JobUpdate(qc_notes="Committed"))
+    # Kept until the write commits
+    assert job_cache.get(job.id) is not None
+    await db_session.commit()
+    assert job_cache.get(job.id) is None
+
+    assert (await service.get(job.id)).qc_notes == "Committed"
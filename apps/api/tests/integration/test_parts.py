@@ -0,0 +1,66 @@
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.jobs.models import Job, JobStatus
+from veriqko.parts.models import Part
+
+
+@pytest.fixture
+async def stocked_part(db_session: AsyncSession):
+    job = Job(id=str(uuid4()), serial_number="SN-PARTS", status=JobStatus.INTAKE)
+    part = Part(id=str(uuid4()), sku=f"SKU-{uuid4().hex[:8]}", name="Screen", quantity_on_hand=3)
+    db_session.add_all([job, part])
+    await db_session.flush()
+    return job, part
+
+
+@pytest.mark.asyncio
+async def test_erp_sync_follows_committed_deduction(
+    async_client: AsyncClient, db_engine, stocked_part
+):
+    job, part = stocked_part
+    seen_quantities = []
+
+    async def sync_part_usage(sku, quantity, job_id):
+        # Read from another connection: only committed stock is visible
+        async with db_engine.connect() as conn:
+            seen_quantities.append(
+                await conn.scalar(select(Part.quantity_on_hand).where(Part.id == part.id))
+            )
+        return True
+
+    with patch("veriqko.parts.router.erp_service.sync_part_usage", side_effect=sync_part_usage):
+        response = await async_client.post(
+            "/api/v1/parts/use", params={"job_id": job.id}, json={"part_id": part.id, "quantity": 2}
+        )
+
+    assert response.status_code == 200
+    assert response.json()["synced_at"] is not None
+    assert response.json()["part"]["quantity_on_hand"] == 1
+    assert seen_quantities == [1]
+
+
+@pytest.mark.asyncio
+async def test_lost_stock_race_is_not_synced(
+    async_client: AsyncClient, db_session: AsyncSession, stocked_part
+):
+    job, part = stocked_part
+    # Another withdrawal drains the row after this session loaded the part,
+    # so the pre-check passes on the stale value and the guarded UPDATE fails
+    await db_session.execute(
+        text("UPDATE parts SET quantity_on_hand = 0 WHERE id = :id"), {"id": part.id}
+    )
+    erp = AsyncMock(return_value=True)
+
+    with patch("veriqko.parts.router.erp_service.sync_part_usage", erp):
+        response = await async_client.post(
+            "/api/v1/parts/use", params={"job_id": job.id}, json={"part_id": part.id, "quantity": 2}
+        )
+
+    assert response.status_code == 400
+    erp.assert_not_called()
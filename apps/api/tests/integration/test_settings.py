@@ -0,0 +1,54 @@
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+
+from veriqko.dependencies import get_current_user
+from veriqko.main import app
+from veriqko.settings.router import _settings_cache
+from veriqko.users.models import User, UserRole
+
+
+def _settings_queries(queries: list[str]) -> list[str]:
+    return [q for q in queries if "FROM system_settings" in q]
+
+
+@pytest.fixture
+def settings_admin():
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=str(uuid4()),
+        email="settings@example.com",
+        full_name="Settings",
+        role=UserRole.ADMIN,
+        is_active=True,
+    )
+    _settings_cache.clear()
+    yield
+    _settings_cache.clear()
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.mark.asyncio
+async def test_settings_list_is_cached_until_update(
+    async_client: AsyncClient, settings_admin, count_queries
+):
+    key = f"test.{uuid4().hex[:8]}"
+
+    response = await async_client.get("/api/v1/settings")
+    assert response.status_code == 200
+    assert len(_settings_queries(count_queries)) == 1
+
+    count_queries.clear()
+    response = await async_client.get("/api/v1/settings")
+    assert response.status_code == 200
+    assert _settings_queries(count_queries) == []
+
+    response = await async_client.put(f"/api/v1/settings/{key}", json={"value": 42})
+    assert response.status_code == 200
+
+    count_queries.clear()
+    response = await async_client.get("/api/v1/settings")
+    assert response.status_code == 200
+    # The update cleared the cached list, so the new value is read back
+    assert len(_settings_queries(count_queries)) == 1
+    assert {"key": key, "value": 42, "description": None} in response.json()
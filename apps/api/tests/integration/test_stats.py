@@ -0,0 +1,121 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.dependencies import get_current_user
+from veriqko.jobs.models import Job, JobStatus
+from veriqko.main import app
+from veriqko.stations.models import Station
+from veriqko.stats.cache import stats_cache
+from veriqko.users.models import User, UserRole
+
+
+@pytest.fixture
+def stats_user():
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id="00000000-0000-0000-0000-000000000001",
+        email="stats@example.com",
+        full_name="Stats",
+        role=UserRole.ADMIN,
+    )
+    stats_cache.clear()
+    yield
+    stats_cache.clear()
+
+
+async def _seed_floor(db_session: AsyncSession):
+    """Add two stations and six jobs, newer than any job other tests committed."""
+    now = datetime.now(UTC)
+    bench = Station(
+        id=str(uuid4()), name=f"Bench {uuid4().hex[:8]}", station_type=JobStatus.FUNCTIONAL
+    )
+    retired = Station(
+        id=str(uuid4()),
+        name=f"Retired {uuid4().hex[:8]}",
+        station_type=JobStatus.QC,
+        is_active=False,
+    )
+
+    def job(status, station=None, sla_due_at=None, deleted=False):
+        return Job(
+            id=str(uuid4()),
+            serial_number=f"SN-{uuid4().hex[:8]}",
+            status=status,
+            current_station_id=station.id if station else None,
+            sla_due_at=sla_due_at,
+            deleted_at=now if deleted else None,
+        )
+
+    jobs = {
+        "queued": job(JobStatus.INTAKE, sla_due_at=now - timedelta(hours=1)),
+        "testing": job(JobStatus.FUNCTIONAL, bench, sla_due_at=now + timedelta(hours=1)),
+        "checking": job(JobStatus.QC, bench, sla_due_at=now + timedelta(days=1)),
+        "completed": job(JobStatus.COMPLETED),
+        "failed": job(JobStatus.FAILED, bench),
+        "deleted": job(JobStatus.INTAKE, deleted=True),
+    }
+    # Newest first in the order above
+    for offset, seeded in enumerate(reversed(jobs.values())):
+        seeded.created_at = now + timedelta(hours=1, seconds=offset)
+    db_session.add_all([bench, retired, *jobs.values()])
+    await db_session.flush()
+    return bench, retired, jobs
+
+
+@pytest.mark.asyncio
+async def test_dashboard_counts_and_recent_jobs(
+    async_client: AsyncClient, db_session: AsyncSession, stats_user, count_queries
+):
+    # Other tests commit jobs too, so counts are compared against a baseline
+    before = (await async_client.get("/api/v1/stats/dashboard")).json()["counts"]
+    stats_cache.clear()
+    _, _, jobs = await _seed_floor(db_session)
+    count_queries.clear()
+
+    response = await async_client.get("/api/v1/stats/dashboard")
+
+    assert response.status_code == 200
+    # Status counts and recent jobs come back together
+    assert len(count_queries) == 1
+    body = response.json()
+    assert {key: body["counts"][key] - before[key] for key in before} == {
+        "total": 5,
+        "completed": 1,
+        "failed": 1,
+        "in_progress": 3,
+    }
+    assert [(job["id"], job["sla_status"]) for job in body["recent_activity"]] == [
+        (jobs["queued"].id, "critical"),
+        (jobs["testing"].id, "warning"),
+        (jobs["checking"].id, "healthy"),
+        (jobs["completed"].id, "none"),
+        (jobs["failed"].id, "none"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_floor_groups_open_jobs_by_station(
+    async_client: AsyncClient, db_session: AsyncSession, stats_user, count_queries
+):
+    bench, retired, jobs = await _seed_floor(db_session)
+    count_queries.clear()
+
+    response = await async_client.get("/api/v1/stats/floor")
+
+    assert response.status_code == 200
+    assert len(count_queries) == 1
+    by_id = {entry["id"]: entry for entry in response.json()}
+    # Unassigned comes first and holds only open, live jobs
+    assert next(iter(by_id)) == "unassigned"
+    unassigned = {job["id"] for job in by_id["unassigned"]["jobs"]}
+    assert jobs["queued"].id in unassigned
+    assert not unassigned & {jobs["completed"].id, jobs["deleted"].id}
+    assert by_id[bench.id]["name"] == bench.name
+    assert {job["id"] for job in by_id[bench.id]["jobs"]} == {
+        jobs["testing"].id,
+        jobs["checking"].id,
+    }
+    assert retired.id not in by_id
@@ -0,0 +1,155 @@
+import importlib.util
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import Index, MetaData, Table, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.dependencies import get_current_user
+from veriqko.evidence.models import Evidence, EvidenceType
+from veriqko.jobs.models import Job, JobStatus, TestResult, TestResultStatus, TestStep
+from veriqko.main import app
+from veriqko.users.models import User, UserRole
+
+MIGRATION_026 = (
+    Path(__file__).parents[2] / "alembic" / "versions" / "026_add_unique_test_result_per_step.py"
+)
+
+
+class _Op:
+    """The two ``alembic.op`` calls migration 026 makes, run on one connection.
+
+    The project's own ``alembic/`` package shadows the library when pytest runs
+    from apps/api, so the migration's ``from alembic import op`` is pointed here.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, statement) -> None:
+        self.connection.execute(statement)
+
+    def create_index(self, name, table_name, columns, unique=False) -> None:
+        table = Table(table_name, MetaData(), autoload_with=self.connection)
+        Index(name, *(table.c[column] for column in columns), unique=unique).create(self.connection)
+
+
+def _run_upgrade(connection, path: Path) -> None:
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    alembic = type(sys)("alembic")
+    alembic.op = _Op(connection)
+    saved = sys.modules.get("alembic")
+    sys.modules["alembic"] = alembic
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        if saved is None:
+            sys.modules.pop("alembic", None)
+        else:
+            sys.modules["alembic"] = saved
+    module.upgrade()
+
+
+@pytest.fixture
+async def step_job(db_session: AsyncSession):
+    user = User(
+        id=str(uuid4()),
+        email=f"{uuid4().hex}@example.com",
+        hashed_password="x",
+        full_name="Tester",
+        role=UserRole.TECHNICIAN,
+        is_active=True,
+        mfa_enabled=False,
+    )
+    job = Job(id=str(uuid4()), serial_number="SN-STEPS", status=JobStatus.INTAKE)
+    step = TestStep(
+        id=str(uuid4()),
+        station_type=JobStatus.INTAKE,
+        name="Power on",
+        sequence_order=1,
+    )
+    db_session.add_all([user, job, step])
+    await db_session.flush()
+    app.dependency_overrides[get_current_user] = lambda: user
+    yield user, job, step
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.mark.asyncio
+async def test_resubmitted_result_updates_in_place(
+    async_client: AsyncClient, db_session: AsyncSession, step_job
+):
+    _, job, step = step_job
+    url = f"/api/v1/jobs/{job.id}/results/{step.id}"
+
+    response = await async_client.post(url, json={"status": "fail", "notes": "No boot"})
+    assert response.status_code == 200
+    response = await async_client.post(url, json={"status": "pass", "notes": "Reseated"})
+    assert response.status_code == 200
+
+    results = await db_session.execute(
+        select(TestResult.status, TestResult.notes).where(TestResult.job_id == job.id)
+    )
+    assert results.all() == [(TestResultStatus.PASS, "Reseated")]
+
+
+@pytest.mark.asyncio
+async def test_migration_026_keeps_latest_result(db_session: AsyncSession, step_job):
+    user, job, step = step_job
+    await db_session.execute(text("DROP INDEX ux_test_results_job_step"))
+    now = datetime.now(UTC)
+    results = [
+        TestResult(
+            id=str(uuid4()),
+            job_id=job.id,
+            test_step_id=step.id,
+            status=status,
+            performed_by_id=user.id,
+            performed_at=performed_at,
+        )
+        for status, performed_at in [
+            (TestResultStatus.FAIL, now - timedelta(minutes=5)),
+            (TestResultStatus.PASS, now),
+            (TestResultStatus.FAIL, now - timedelta(minutes=1)),
+        ]
+    ]
+    db_session.add_all(results)
+    await db_session.flush()
+    stale, latest = results[0], results[1]
+    db_session.add(
+        Evidence(
+            id=str(uuid4()),
+            job_id=job.id,
+            test_result_id=stale.id,
+            evidence_type=EvidenceType.PHOTO,
+            original_filename="board.jpg",
+            stored_filename="board.jpg",
+            file_path="evidence/board.jpg",
+            file_size_bytes=1,
+            mime_type="image/jpeg",
+            sha256_hash="0" * 64,
+            captured_at=now,
+            created_at=now,
+            captured_by_id=user.id,
+        )
+    )
+    await db_session.flush()
+
+    connection = await db_session.connection()
+    await connection.run_sync(_run_upgrade, MIGRATION_026)
+
+    kept = (
+        await db_session.scalars(select(TestResult.id).where(TestResult.job_id == job.id))
+    ).all()
+    assert kept == [latest.id]
+    # Evidence from the dropped duplicates moves to the kept result
+    evidence_result_ids = (
+        await db_session.scalars(select(Evidence.test_result_id).where(Evidence.job_id == job.id))
+    ).all()
+    assert evidence_result_ids == [latest.id]
+    await db_session.rollback()
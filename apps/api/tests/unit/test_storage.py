@@ -64,6 +64,32 @@ async def test_local_storage_delete(local_storage):
     deleted_path = local_storage.base_path / ".deleted" / stored.relative_path
     assert os.path.exists(deleted_path)
 
+@pytest.mark.asyncio
+async def test_local_storage_copy_falls_back_without_sendfile(local_storage, tmp_path, monkeypatch):
+    content = b"on-disk upload"
+    source = tmp_path / "upload.bin"
+    source.write_bytes(content)
+
+    def no_sendfile(*args):
+        raise OSError("sendfile not supported")
+
+    monkeypatch.setattr(os, "sendfile", no_sendfile)
+    with open(source, "rb") as file:
+        stored = await local_storage.save(file, "job_1", "test.jpg", "image/jpeg")
+
+    assert stored.absolute_path.read_bytes() == content
+
+@pytest.mark.asyncio
+async def test_local_storage_short_copy_raises(local_storage, tmp_path, monkeypatch):
+    source = tmp_path / "upload.bin"
+    source.write_bytes(b"on-disk upload")
+    monkeypatch.setattr(os, "sendfile", lambda *args: 0)
+
+    with open(source, "rb") as file, pytest.raises(OSError, match="Upload truncated"):
+        await local_storage.save(file, "job_1", "test.jpg", "image/jpeg")
+
+    assert not any(path.is_file() for path in (tmp_path / "evidence").rglob("*"))
+
 def test_sanitize_filename(local_storage):
     assert local_storage._sanitize_filename("hello world!.jpg") == "hello_world_.jpg"
     assert local_storage._sanitize_filename("very/unsafe/path.pdf") == "very_unsafe_path.pdf"